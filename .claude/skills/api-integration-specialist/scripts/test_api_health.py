@@ -2,15 +2,149 @@
 """
 Test API health and basic connectivity
 """
+import io
+import os
 import sys
+import json
 import time
+import asyncio
+import hashlib
 import argparse
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from requests.adapters import HTTPAdapter
 
-def test_api_health(base_url, endpoints=None, timeout=10):
+try:
+    import aiohttp
+except ImportError:  # Optional: only used for very large endpoint lists
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:  # Optional: enables HTTP/2 multiplexing
+    httpx = None
+
+# Upper bound on concurrent probes (and pooled connections per host)
+MAX_WORKERS = 32
+
+# Endpoint count above which probing switches to asyncio + aiohttp
+ASYNC_THRESHOLD = 100
+ASYNC_CONNECTION_LIMIT = 1024
+
+# Errors raised by whichever client create_session returns
+TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+if httpx is not None:
+    TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    CONNECTION_ERRORS += (httpx.TransportError,)
+
+# ETag/Last-Modified validators from previous runs, one JSON file per URL
+# (only used with --cache)
+CACHE_DIR = Path.home() / '.cache' / 'api_health'
+
+# Methods that may be replayed as conditional requests
+CONDITIONAL_METHODS = ('GET', 'HEAD')
+
+def create_session(pool_size=MAX_WORKERS):
+    """
+    Create an HTTP client with a keep-alive connection pool
+    
+    Uses an HTTP/2 httpx Client when httpx and h2 are installed, so probes
+    against one host multiplex over a single TLS connection; otherwise a
+    pooled requests Session. Both expose the same request() interface.
+    """
+    if httpx is not None:
+        try:
+            return httpx.Client(
+                http2=True,
+                follow_redirects=True,  # Match requests' default
+                limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+            )
+        except ImportError:  # http2=True needs the h2 package
+            pass
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def cache_path(cache_dir, url):
+    """Path of the validator cache entry for a URL"""
+    return Path(cache_dir) / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+def endpoint_url(base_url, endpoint):
+    """Full URL probed for an endpoint"""
+    return f"{base_url.rstrip('/')}{endpoint['path']}"
+
+def load_validators(cache_dir, base_url, endpoints):
+    """
+    Load cached ETag/Last-Modified validators for every conditional endpoint
+    
+    Returns {url: validators}, read once before any probe starts so the
+    probes themselves never touch the disk.
+    """
+    cached = {}
+    for endpoint in endpoints:
+        if endpoint.get('method', 'GET') not in CONDITIONAL_METHODS:
+            continue
+        url = endpoint_url(base_url, endpoint)
+        if url in cached:
+            continue
+        try:
+            with open(cache_path(cache_dir, url)) as f:
+                cached[url] = json.load(f)
+        except (OSError, ValueError):
+            pass
+    return cached
+
+def conditional_headers(validators):
+    """Build If-None-Match/If-Modified-Since headers from cached validators"""
+    headers = {}
+    if validators:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    return headers
+
+def record_validators(updates, method, url, status_code, headers):
+    """Remember validators from a full response so the next run can revalidate"""
+    if updates is None or method not in CONDITIONAL_METHODS or status_code == 304:
+        return
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    if etag or last_modified:
+        updates[url] = {'etag': etag, 'last_modified': last_modified, 'status': status_code}
+
+def store_validators(cache_dir, updates):
+    """Persist the validators recorded during a run, once all probes are done"""
+    for url, validators in updates.items():
+        path = cache_path(cache_dir, url)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(validators, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # Caching is best-effort
+
+def effective_status(status_code, validators):
+    """Map a 304 Not Modified back to the status code it revalidated"""
+    if status_code == 304 and validators:
+        return validators.get('status', status_code)
+    return status_code
+
+def test_api_health(base_url, endpoints=None, timeout=10, cache_dir=None):
     """
     Test API health across multiple endpoints
+    
+    When cache_dir is given, unchanged GET/HEAD endpoints are revalidated
+    with the ETag/Last-Modified validators cached there and a 304 counts as
+    the status it revalidated. By default every probe fetches a full response.
     """
     print(f"Testing API: {base_url}")
     print(f"Timestamp: {datetime.now().isoformat()}")
@@ -24,125 +158,194 @@ def test_api_health(base_url, endpoints=None, timeout=10):
             {'path': '/', 'method': 'GET', 'expected': 200}
         ]
     
-    results = []
+    cached = updates = None
+    if cache_dir is not None:
+        cached = load_validators(cache_dir, base_url, endpoints)
+        updates = {}
     
-    for endpoint in endpoints:
-        path = endpoint['path']
-        method = endpoint.get('method', 'GET')
-        expected_status = endpoint.get('expected', 200)
+    # Very large endpoint lists go through a single asyncio event loop
+    # instead of blocking one thread per in-flight socket
+    if aiohttp is not None and len(endpoints) > ASYNC_THRESHOLD:
+        results = asyncio.run(probe_all_async(base_url, endpoints, timeout, cached, updates))
+    else:
+        results = probe_all(base_url, endpoints, timeout, cached, updates)
+    
+    if cache_dir is not None:
+        store_validators(cache_dir, updates)
+    
+    # Format the whole report in memory and emit it with a single write
+    buf = io.StringIO()
+    for result in results:
+        print_result(result, file=buf)
+    
+    print("=" * 60, file=buf)
+    print_summary(results, file=buf)
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+    
+    # Return True if all tests passed
+    return all(r['status'] == "✅ PASS" for r in results)
+
+def make_result(endpoint, status, status_code=None, response_time_ms=None, error=None):
+    """Build a result record for a probed endpoint"""
+    return {
+        'endpoint': endpoint['path'],
+        'method': endpoint.get('method', 'GET'),
+        'status': status,
+        'status_code': status_code,
+        'expected_code': endpoint.get('expected', 200),
+        'response_time_ms': response_time_ms,
+        'error': error
+    }
+
+def probe_all(base_url, endpoints, timeout, cached=None, updates=None):
+    """
+    Probe endpoints concurrently from a thread pool sharing one pooled client
+    
+    cached maps URLs to validators loaded by load_validators; validators
+    from full responses are added to updates. Both are None without a cache.
+    """
+    session = create_session()
+    
+    def probe(endpoint):
+        return probe_endpoint(session, base_url, endpoint, timeout, cached, updates)
+    
+    # Probes are network-bound, so fan out over a thread pool; ex.map keeps
+    # results in endpoint order
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(endpoints)))) as ex:
+            return list(ex.map(probe, endpoints))
+    finally:
+        session.close()
+
+def probe_endpoint(session, base_url, endpoint, timeout, cached=None, updates=None):
+    """
+    Probe a single endpoint and return its result record
+    """
+    method = endpoint.get('method', 'GET')
+    expected_status = endpoint.get('expected', 200)
+    
+    url = endpoint_url(base_url, endpoint)
+    validators = cached.get(url) if cached and method in CONDITIONAL_METHODS else None
+    
+    try:
+        start_time = time.perf_counter_ns()
         
-        url = f"{base_url.rstrip('/')}{path}"
+        response = session.request(method, url, timeout=timeout,
+                                   headers=conditional_headers(validators))
         
-        try:
-            start_time = time.time()
-            
-            if method == 'GET':
-                response = requests.get(url, timeout=timeout)
-            elif method == 'POST':
-                response = requests.post(url, timeout=timeout)
-            else:
-                response = requests.request(method, url, timeout=timeout)
-            
-            duration = (time.time() - start_time) * 1000  # Convert to ms
-            
-            status = "✅ PASS" if response.status_code == expected_status else "❌ FAIL"
-            
-            result = {
-                'endpoint': path,
-                'method': method,
-                'status': status,
-                'status_code': response.status_code,
-                'expected_code': expected_status,
-                'response_time_ms': round(duration, 2),
-                'error': None
-            }
-            
-        except requests.exceptions.Timeout:
-            result = {
-                'endpoint': path,
-                'method': method,
-                'status': "❌ TIMEOUT",
-                'status_code': None,
-                'expected_code': expected_status,
-                'response_time_ms': timeout * 1000,
-                'error': f"Request timeout ({timeout}s)"
-            }
-            
-        except requests.exceptions.ConnectionError as e:
-            result = {
-                'endpoint': path,
-                'method': method,
-                'status': "❌ CONNECTION ERROR",
-                'status_code': None,
-                'expected_code': expected_status,
-                'response_time_ms': None,
-                'error': str(e)
-            }
-            
-        except Exception as e:
-            result = {
-                'endpoint': path,
-                'method': method,
-                'status': "❌ ERROR",
-                'status_code': None,
-                'expected_code': expected_status,
-                'response_time_ms': None,
-                'error': str(e)
-            }
+        duration = (time.perf_counter_ns() - start_time) / 1e6  # Convert to ms
+        
+        record_validators(updates, method, url, response.status_code, response.headers)
+        passed = effective_status(response.status_code, validators) == expected_status
+        status = "✅ PASS" if passed else "❌ FAIL"
+        return make_result(endpoint, status, response.status_code, duration)
+        
+    except TIMEOUT_ERRORS:
+        return make_result(endpoint, "❌ TIMEOUT", response_time_ms=timeout * 1000,
+                           error=f"Request timeout ({timeout}s)")
         
-        results.append(result)
-        print_result(result)
+    except CONNECTION_ERRORS as e:
+        return make_result(endpoint, "❌ CONNECTION ERROR", error=str(e))
+        
+    except Exception as e:
+        return make_result(endpoint, "❌ ERROR", error=str(e))
+
+async def probe_all_async(base_url, endpoints, timeout, cached=None, updates=None):
+    """
+    Probe endpoints from one event loop; requires aiohttp
+    """
+    connector = aiohttp.TCPConnector(limit=ASYNC_CONNECTION_LIMIT, ttl_dns_cache=300)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
     
-    print("=" * 60)
-    print_summary(results)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        return await asyncio.gather(
+            *(probe_endpoint_async(session, base_url, endpoint, timeout, cached, updates)
+              for endpoint in endpoints)
+        )
+
+async def probe_endpoint_async(session, base_url, endpoint, timeout, cached=None, updates=None):
+    """
+    Async counterpart of probe_endpoint for an aiohttp ClientSession
+    """
+    method = endpoint.get('method', 'GET')
+    expected_status = endpoint.get('expected', 200)
     
-    # Return True if all tests passed
-    return all(r['status'] == "✅ PASS" for r in results)
+    url = endpoint_url(base_url, endpoint)
+    validators = cached.get(url) if cached and method in CONDITIONAL_METHODS else None
+    
+    try:
+        start_time = time.perf_counter_ns()
+        
+        async with session.request(method, url, headers=conditional_headers(validators)) as response:
+            await response.read()
+        
+        duration = (time.perf_counter_ns() - start_time) / 1e6  # Convert to ms
+        
+        record_validators(updates, method, url, response.status, response.headers)
+        passed = effective_status(response.status, validators) == expected_status
+        status = "✅ PASS" if passed else "❌ FAIL"
+        return make_result(endpoint, status, response.status, duration)
+        
+    except asyncio.TimeoutError:
+        return make_result(endpoint, "❌ TIMEOUT", response_time_ms=timeout * 1000,
+                           error=f"Request timeout ({timeout}s)")
+        
+    except aiohttp.ClientConnectionError as e:
+        return make_result(endpoint, "❌ CONNECTION ERROR", error=str(e))
+        
+    except Exception as e:
+        return make_result(endpoint, "❌ ERROR", error=str(e))
 
-def print_result(result):
-    """Print individual test result"""
-    print(f"\n{result['status']} {result['method']} {result['endpoint']}")
+def print_result(result, file=None):
+    """Print individual test result (to stdout unless file is given)"""
+    print(f"\n{result['status']} {result['method']} {result['endpoint']}", file=file)
     
     if result['status_code']:
-        print(f"  Status Code: {result['status_code']} (expected: {result['expected_code']})")
+        print(f"  Status Code: {result['status_code']} (expected: {result['expected_code']})", file=file)
     
     if result['response_time_ms']:
         time_status = "🔴" if result['response_time_ms'] > 1000 else "🟢"
-        print(f"  Response Time: {time_status} {result['response_time_ms']}ms")
+        print(f"  Response Time: {time_status} {result['response_time_ms']:.2f}ms", file=file)
     
     if result['error']:
-        print(f"  Error: {result['error']}")
+        print(f"  Error: {result['error']}", file=file)
 
-def print_summary(results):
-    """Print test summary"""
+def print_summary(results, file=None):
+    """Print test summary (to stdout unless file is given)"""
     total = len(results)
     passed = sum(1 for r in results if r['status'] == "✅ PASS")
     failed = total - passed
     
-    print(f"\nSUMMARY:")
-    print(f"  Total Tests: {total}")
-    print(f"  Passed: {passed}")
-    print(f"  Failed: {failed}")
+    print(f"\nSUMMARY:", file=file)
+    print(f"  Total Tests: {total}", file=file)
+    print(f"  Passed: {passed}", file=file)
+    print(f"  Failed: {failed}", file=file)
     
     # Calculate average response time (for successful requests)
     response_times = [r['response_time_ms'] for r in results if r['response_time_ms']]
     if response_times:
         avg_time = sum(response_times) / len(response_times)
-        print(f"  Average Response Time: {avg_time:.2f}ms")
+        print(f"  Average Response Time: {avg_time:.2f}ms", file=file)
     
     if failed == 0:
-        print(f"\n✅ All API health checks passed!")
+        print(f"\n✅ All API health checks passed!", file=file)
     else:
-        print(f"\n❌ {failed} health check(s) failed!")
+        print(f"\n❌ {failed} health check(s) failed!", file=file)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Test API health and connectivity')
     parser.add_argument('--base-url', required=True, help='Base URL of the API')
     parser.add_argument('--timeout', type=int, default=10, help='Request timeout in seconds')
+    parser.add_argument('--cache', action='store_true',
+                        help=f'Revalidate with ETag/Last-Modified validators cached in {CACHE_DIR}; '
+                             'a 304 then reports the status cached on the previous run')
     
     args = parser.parse_args()
     
     # Run health checks
-    all_passed = test_api_health(args.base_url, timeout=args.timeout)
+    all_passed = test_api_health(args.base_url, timeout=args.timeout,
+                                 cache_dir=CACHE_DIR if args.cache else None)
     
     sys.exit(0 if all_passed else 1)
@@ -7,6 +7,28 @@ import json
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml-backed C loader and orjson when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Path item keys validated as operations; others (parameters, servers, ...) are skipped
+HTTP_METHODS = frozenset(('get', 'post', 'put', 'patch', 'delete', 'options', 'head'))
+BODY_METHODS = frozenset(('post', 'put', 'patch'))
+
+# Info section checks as (field, is_error, message), built once at import
+INFO_FIELD_RULES = (
+    ('title', True, "Missing API title in info section"),
+    ('version', True, "Missing API version in info section"),
+    ('description', False, "Missing API description in info section"),
+)
+
 def validate_openapi_spec(spec_path):
     """
     Validate OpenAPI specification file
@@ -15,11 +37,11 @@ def validate_openapi_spec(spec_path):
     
     # Read spec file
     try:
-        with open(spec_path) as f:
+        with open(spec_path, 'rb') as f:
             if spec_path.endswith('.json'):
-                spec = json.load(f)
+                spec = json_loads(f.read())
             else:
-                spec = yaml.safe_load(f)
+                spec = yaml.load(f, Loader=SafeLoader)
     except Exception as e:
         return False, [f"Failed to parse file: {e}"]
     
@@ -37,12 +59,9 @@ def validate_openapi_spec(spec_path):
         errors.append("Missing 'info' section")
     else:
         info = spec['info']
-        if 'title' not in info:
-            errors.append("Missing API title in info section")
-        if 'version' not in info:
-            errors.append("Missing API version in info section")
-        if 'description' not in info:
-            warnings.append("Missing API description in info section")
+        for field, is_error, message in INFO_FIELD_RULES:
+            if field not in info:
+                (errors if is_error else warnings).append(message)
     
     # Check paths
     if 'paths' not in spec or not spec['paths']:
@@ -88,38 +107,42 @@ def validate_paths(paths, errors, warnings):
             errors.append(f"Path '{path}' must start with '/'")
         
         for method, operation in methods.items():
-            if method not in ['get', 'post', 'put', 'patch', 'delete', 'options', 'head']:
+            if method not in HTTP_METHODS:
                 continue
             
+            label = f"{method.upper()} {path}"
+            
             # Check operation ID
             if 'operationId' not in operation:
-                warnings.append(f"{method.upper()} {path}: Missing operationId")
+                warnings.append(f"{label}: Missing operationId")
             
             # Check description
             if 'description' not in operation and 'summary' not in operation:
-                warnings.append(f"{method.upper()} {path}: Missing description/summary")
+                warnings.append(f"{label}: Missing description/summary")
             
             # Check responses
             if 'responses' not in operation:
-                errors.append(f"{method.upper()} {path}: Missing responses")
+                errors.append(f"{label}: Missing responses")
             else:
                 validate_responses(operation['responses'], path, method, warnings)
             
             # Check request body for POST/PUT/PATCH
-            if method in ['post', 'put', 'patch']:
+            if method in BODY_METHODS:
                 if 'requestBody' not in operation:
-                    warnings.append(f"{method.upper()} {path}: Missing requestBody")
+                    warnings.append(f"{label}: Missing requestBody")
 
 def validate_responses(responses, path, method, warnings):
     """Validate response definitions"""
+    label = f"{method.upper()} {path}"
+    
     if '200' not in responses and '201' not in responses:
-        warnings.append(f"{method.upper()} {path}: No success response (200/201) defined")
+        warnings.append(f"{label}: No success response (200/201) defined")
     
-    if '400' not in responses and method in ['post', 'put', 'patch']:
-        warnings.append(f"{method.upper()} {path}: No 400 Bad Request response defined")
+    if '400' not in responses and method in BODY_METHODS:
+        warnings.append(f"{label}: No 400 Bad Request response defined")
     
     if '401' not in responses:
-        warnings.append(f"{method.upper()} {path}: No 401 Unauthorized response defined")
+        warnings.append(f"{label}: No 401 Unauthorized response defined")
 
 def validate_components(components, errors, warnings):
     """Validate component definitions"""
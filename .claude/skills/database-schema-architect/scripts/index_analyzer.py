@@ -3,40 +3,106 @@
 Index Analyzer
 Analyzes SQL queries and suggests optimal indexes for performance improvement.
 """
+import io
+import os
 import sys
 import re
 import json
-from typing import List, Dict, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from sys import intern  # Table/column/index names repeat across recommendations
+from typing import List, Dict, Tuple, Optional
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Use google-re2's linear-time automaton matcher when installed. The
+# IndexAnalyzer patterns use no backreferences or lookarounds and set
+# their flags inline, so either engine compiles them unchanged.
+try:
+    import re2 as regex_engine
+except ImportError:
+    regex_engine = re
+
+# Number of distinct query strings whose parse results are memoized
+PARSE_CACHE_SIZE = 8192
+
+# Batches with at least this many distinct queries are parsed across
+# worker processes, when there is more than one CPU
+PARALLEL_THRESHOLD = 5000
+PARALLEL_CHUNKSIZE = 64
+
+# Priority labels from most to least urgent, and their integer rank
+PRIORITIES = ('critical', 'high', 'medium', 'low')
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(reversed(PRIORITIES))}
+
+# SQL keywords that the WHERE column pattern can pick up as false positives
+SQL_KEYWORDS = frozenset((
+    'and', 'or', 'not', 'null', 'true', 'false', 'select', 'from', 'where',
+    'is', 'in', 'like', 'between', 'exists'
+))
+
+@dataclass(slots=True)
+class IndexRecommendation:
+    """A suggested index; slotted to keep large batches compact"""
+    type: str
+    table: str
+    columns: Tuple[str, ...]
+    index_name: str
+    sql: str
+    reason: str
+    priority: str
+    note: Optional[str] = None
+    query_frequency: Optional[int] = None
+    rank: int = field(init=False)
+    
+    def __post_init__(self):
+        self.rank = PRIORITY_RANK.get(self.priority, 0)
 
 class IndexAnalyzer:
+    # Patterns are compiled once and shared by every query
+    FROM_RE = regex_engine.compile(r'(?i)FROM\s+([a-zA-Z_][a-zA-Z0-9_]*)')
+    UPDATE_RE = regex_engine.compile(r'(?i)UPDATE\s+([a-zA-Z_][a-zA-Z0-9_]*)')
+    DELETE_RE = regex_engine.compile(r'(?i)DELETE\s+FROM\s+([a-zA-Z_][a-zA-Z0-9_]*)')
+    WHERE_RE = regex_engine.compile(r'(?is)WHERE\s+(.+?)(?:GROUP BY|ORDER BY|LIMIT|;|$)')
+    WHERE_COLUMN_RE = regex_engine.compile(r'(?i)([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:=|>|<|>=|<=|!=|<>|LIKE|IN|IS)')
+    JOIN_RE = regex_engine.compile(
+        r'(?i)JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+.*?ON\s+([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)'
+        r'\s*=\s*([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)'
+    )
+    ORDER_BY_RE = regex_engine.compile(r'(?i)ORDER BY\s+(.+?)(?:LIMIT|;|$)')
+    ORDER_COLUMN_RE = regex_engine.compile(r'\s*([a-zA-Z_][a-zA-Z0-9_]*)')
+    
+    # Bound search methods for FROM, then UPDATE, then DELETE
+    TABLE_SEARCHES = (FROM_RE.search, UPDATE_RE.search, DELETE_RE.search)
+    
     def __init__(self):
         self.recommendations = []
         self.existing_indexes = {}
+        # Query logs repeat the same statement many times; parse each once.
+        # Keyed on the exact text: the patterns are whitespace- and
+        # literal-sensitive, so reformatted variants may parse differently
+        self._parse_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(self._parse_uncached)
         
     def extract_table_from_query(self, query: str) -> str:
         """Extract main table name from query"""
-        query_upper = query.upper()
-        
-        # Handle FROM clause
-        from_match = re.search(r'FROM\s+([a-zA-Z_][a-zA-Z0-9_]*)', query_upper)
-        if from_match:
-            return from_match.group(1).lower()
-        
-        # Handle UPDATE
-        update_match = re.search(r'UPDATE\s+([a-zA-Z_][a-zA-Z0-9_]*)', query_upper)
-        if update_match:
-            return update_match.group(1).lower()
-        
-        # Handle DELETE
-        delete_match = re.search(r'DELETE\s+FROM\s+([a-zA-Z_][a-zA-Z0-9_]*)', query_upper)
-        if delete_match:
-            return delete_match.group(1).lower()
+        # Handle FROM clause, then UPDATE, then DELETE
+        for search in self.TABLE_SEARCHES:
+            match = search(query)
+            if match:
+                return intern(match.group(1).lower())
         
         return None
     
     def extract_where_columns(self, query: str, table_name: str) -> List[str]:
         """Extract columns used in WHERE clause"""
-        where_match = re.search(r'WHERE\s+(.+?)(?:GROUP BY|ORDER BY|LIMIT|;|$)', query, re.IGNORECASE | re.DOTALL)
+        where_match = self.WHERE_RE.search(query)
         if not where_match:
             return []
         
@@ -44,40 +110,40 @@ class IndexAnalyzer:
         
         # Extract column names (simplified - handles basic cases)
         columns = []
+        seen = set()
         
         # Match patterns like: column_name =, column_name >, column_name IN, etc.
-        pattern = r'([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:=|>|<|>=|<=|!=|<>|LIKE|IN|IS)'
-        matches = re.findall(pattern, where_clause, re.IGNORECASE)
+        matches = self.WHERE_COLUMN_RE.findall(where_clause)
         
         for match in matches:
-            col = match.lower()
-            # Filter out SQL keywords
-            if col not in ['and', 'or', 'not', 'null', 'true', 'false', 'select', 'from', 'where']:
+            col = intern(match.lower())
+            # Filter out SQL keywords and duplicates while preserving order
+            if col not in SQL_KEYWORDS and col not in seen:
+                seen.add(col)
                 columns.append(col)
         
-        return list(dict.fromkeys(columns))  # Remove duplicates while preserving order
+        return columns
     
     def extract_join_columns(self, query: str) -> List[Tuple[str, str]]:
         """Extract columns used in JOIN conditions"""
         joins = []
         
         # Match JOIN patterns
-        join_pattern = r'JOIN\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+.*?ON\s+([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*([a-zA-Z_][a-zA-Z0-9_]*)\.([a-zA-Z_][a-zA-Z0-9_]*)'
-        matches = re.findall(join_pattern, query, re.IGNORECASE)
+        matches = self.JOIN_RE.findall(query)
         
         for match in matches:
-            table_name = match[0].lower()
-            left_col = match[2].lower()
-            right_col = match[4].lower()
+            table_name = intern(match[0].lower())
+            left_col = intern(match[2].lower())
+            right_col = intern(match[4].lower())
             
             joins.append((table_name, left_col))
-            joins.append((match[3].lower(), right_col))
+            joins.append((intern(match[3].lower()), right_col))
         
         return joins
     
     def extract_order_by_columns(self, query: str, table_name: str) -> List[str]:
         """Extract columns used in ORDER BY clause"""
-        order_match = re.search(r'ORDER BY\s+(.+?)(?:LIMIT|;|$)', query, re.IGNORECASE)
+        order_match = self.ORDER_BY_RE.search(query)
         if not order_match:
             return []
         
@@ -88,87 +154,108 @@ class IndexAnalyzer:
         parts = order_clause.split(',')
         for part in parts:
             # Remove ASC/DESC and extract column name
-            col_match = re.match(r'\s*([a-zA-Z_][a-zA-Z0-9_]*)', part.strip())
+            col_match = self.ORDER_COLUMN_RE.match(part.strip())
             if col_match:
-                columns.append(col_match.group(1).lower())
+                columns.append(intern(col_match.group(1).lower()))
         
         return columns
     
+    def _parse(self, query: str) -> Tuple:
+        """Parse a query once into (table, where_columns, join_columns, order_by_columns)"""
+        table_name, where_columns, join_columns, order_by_columns = \
+            self._parse_cached(query)
+        
+        # Cached results are shared, so hand out fresh lists
+        return table_name, list(where_columns), list(join_columns), list(order_by_columns)
+    
+    def _parse_uncached(self, query: str) -> Tuple:
+        """Parse a query into an immutable tuple of its clauses"""
+        table_name = self.extract_table_from_query(query)
+        if not table_name:
+            return None, (), (), ()
+        
+        return (
+            table_name,
+            tuple(self.extract_where_columns(query, table_name)),
+            tuple(self.extract_join_columns(query)),
+            tuple(self.extract_order_by_columns(query, table_name))
+        )
+    
     def analyze_query(self, query: str, query_frequency: int = 1) -> Dict:
         """Analyze a single query and generate index recommendations"""
-        table_name = self.extract_table_from_query(query)
+        return self._analyze_parsed(query, self._parse(query), query_frequency)
+    
+    def _analyze_parsed(self, query: str, parsed: Tuple, query_frequency: int) -> Dict:
+        """Generate index recommendations from a query's fresh _parse result"""
+        table_name, where_columns, join_columns, order_by_columns = parsed
         if not table_name:
             return {
                 "error": "Could not identify main table in query",
                 "query": query
             }
         
-        where_columns = self.extract_where_columns(query, table_name)
-        join_columns = self.extract_join_columns(query)
-        order_by_columns = self.extract_order_by_columns(query, table_name)
-        
         recommendations = []
         
         # Recommend indexes for WHERE clause columns
         if where_columns:
             if len(where_columns) == 1:
-                idx_name = f"idx_{table_name}_{where_columns[0]}"
-                recommendations.append({
-                    "type": "single_column",
-                    "table": table_name,
-                    "columns": where_columns,
-                    "index_name": idx_name,
-                    "sql": f"CREATE INDEX {idx_name} ON {table_name}({where_columns[0]});",
-                    "reason": f"Column '{where_columns[0]}' used in WHERE clause",
-                    "priority": "high" if query_frequency > 100 else "medium"
-                })
+                idx_name = intern(f"idx_{table_name}_{where_columns[0]}")
+                recommendations.append(IndexRecommendation(
+                    type="single_column",
+                    table=table_name,
+                    columns=tuple(where_columns),
+                    index_name=idx_name,
+                    sql=f"CREATE INDEX {idx_name} ON {table_name}({where_columns[0]});",
+                    reason=f"Column '{where_columns[0]}' used in WHERE clause",
+                    priority="high" if query_frequency > 100 else "medium"
+                ))
             else:
                 # Composite index for multiple WHERE columns
-                idx_name = f"idx_{table_name}_{'_'.join(where_columns[:3])}"  # Limit to 3 columns
+                idx_name = intern(f"idx_{table_name}_{'_'.join(where_columns[:3])}")  # Limit to 3 columns
                 columns_str = ', '.join(where_columns[:3])
-                recommendations.append({
-                    "type": "composite",
-                    "table": table_name,
-                    "columns": where_columns[:3],
-                    "index_name": idx_name,
-                    "sql": f"CREATE INDEX {idx_name} ON {table_name}({columns_str});",
-                    "reason": f"Multiple columns used together in WHERE clause",
-                    "priority": "high" if query_frequency > 100 else "medium",
-                    "note": "Column order matters! Most selective column should be first."
-                })
+                recommendations.append(IndexRecommendation(
+                    type="composite",
+                    table=table_name,
+                    columns=tuple(where_columns[:3]),
+                    index_name=idx_name,
+                    sql=f"CREATE INDEX {idx_name} ON {table_name}({columns_str});",
+                    reason=f"Multiple columns used together in WHERE clause",
+                    priority="high" if query_frequency > 100 else "medium",
+                    note="Column order matters! Most selective column should be first."
+                ))
         
         # Recommend indexes for JOIN columns
         for table, column in join_columns:
-            idx_name = f"idx_{table}_{column}"
+            idx_name = intern(f"idx_{table}_{column}")
             existing_table_indexes = self.existing_indexes.get(table, set())
             
             if idx_name not in existing_table_indexes:
-                recommendations.append({
-                    "type": "foreign_key",
-                    "table": table,
-                    "columns": [column],
-                    "index_name": idx_name,
-                    "sql": f"CREATE INDEX {idx_name} ON {table}({column});",
-                    "reason": f"Column '{column}' used in JOIN condition",
-                    "priority": "critical"  # Foreign keys must always be indexed
-                })
+                recommendations.append(IndexRecommendation(
+                    type="foreign_key",
+                    table=table,
+                    columns=(column,),
+                    index_name=idx_name,
+                    sql=f"CREATE INDEX {idx_name} ON {table}({column});",
+                    reason=f"Column '{column}' used in JOIN condition",
+                    priority="critical"  # Foreign keys must always be indexed
+                ))
         
         # Recommend covering index if ORDER BY present with WHERE
         if where_columns and order_by_columns:
             covering_columns = where_columns + [col for col in order_by_columns if col not in where_columns]
             if len(covering_columns) <= 4:  # Don't create overly wide indexes
-                idx_name = f"idx_{table_name}_{'_'.join(covering_columns[:4])}"
+                idx_name = intern(f"idx_{table_name}_{'_'.join(covering_columns[:4])}")
                 columns_str = ', '.join(covering_columns[:4])
-                recommendations.append({
-                    "type": "covering",
-                    "table": table_name,
-                    "columns": covering_columns[:4],
-                    "index_name": idx_name,
-                    "sql": f"CREATE INDEX {idx_name} ON {table_name}({columns_str});",
-                    "reason": "Covering index for WHERE + ORDER BY optimization",
-                    "priority": "medium" if query_frequency > 50 else "low",
-                    "note": "This index can satisfy both WHERE and ORDER BY without table access"
-                })
+                recommendations.append(IndexRecommendation(
+                    type="covering",
+                    table=table_name,
+                    columns=tuple(covering_columns[:4]),
+                    index_name=idx_name,
+                    sql=f"CREATE INDEX {idx_name} ON {table_name}({columns_str});",
+                    reason="Covering index for WHERE + ORDER BY optimization",
+                    priority="medium" if query_frequency > 50 else "low",
+                    note="This index can satisfy both WHERE and ORDER BY without table access"
+                ))
         
         return {
             "table": table_name,
@@ -186,34 +273,51 @@ class IndexAnalyzer:
         """Analyze multiple queries and prioritize recommendations"""
         all_recommendations = []
         
+        # Regex parsing is CPU-bound, so many distinct queries are parsed
+        # over worker processes. Duplicates are folded first, since each
+        # worker has its own parse cache; small batches or a single CPU are
+        # not worth the startup cost
+        parsed = {}
+        if len(queries) >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+            unique_queries = list(dict.fromkeys(query_info.get('query') for query_info in queries))
+            if len(unique_queries) >= PARALLEL_THRESHOLD:
+                with ProcessPoolExecutor(initializer=_init_worker) as ex:
+                    parsed = dict(zip(
+                        unique_queries,
+                        ex.map(_parse_one, unique_queries, chunksize=PARALLEL_CHUNKSIZE),
+                        strict=True
+                    ))
+        
         for query_info in queries:
             query = query_info.get('query')
             frequency = query_info.get('frequency', 1)
             
-            analysis = self.analyze_query(query, frequency)
+            if query in parsed:
+                table_name, where_columns, join_columns, order_by_columns = parsed[query]
+                analysis = self._analyze_parsed(query, (
+                    table_name, list(where_columns), list(join_columns), list(order_by_columns)
+                ), frequency)
+            else:
+                analysis = self.analyze_query(query, frequency)
+            
             if 'error' not in analysis:
                 for rec in analysis.get('recommendations', []):
-                    rec['query_frequency'] = frequency
+                    rec.query_frequency = frequency
                     all_recommendations.append(rec)
         
-        # Group by table and index name to remove duplicates
+        # Group by table and index name to remove duplicates,
+        # keeping the one with higher priority
         unique_recommendations = {}
         for rec in all_recommendations:
-            key = f"{rec['table']}_{rec['index_name']}"
-            if key not in unique_recommendations:
+            key = (rec.table, rec.index_name)
+            existing = unique_recommendations.get(key)
+            if existing is None or rec.rank > existing.rank:
                 unique_recommendations[key] = rec
-            else:
-                # Keep the one with higher priority
-                existing = unique_recommendations[key]
-                priority_order = {'critical': 3, 'high': 2, 'medium': 1, 'low': 0}
-                if priority_order.get(rec['priority'], 0) > priority_order.get(existing['priority'], 0):
-                    unique_recommendations[key] = rec
         
         # Sort by priority
-        priority_order = {'critical': 3, 'high': 2, 'medium': 1, 'low': 0}
         sorted_recommendations = sorted(
             unique_recommendations.values(),
-            key=lambda x: priority_order.get(x['priority'], 0),
+            key=attrgetter('rank'),
             reverse=True
         )
         
@@ -223,6 +327,18 @@ class IndexAnalyzer:
             "recommendations": sorted_recommendations
         }
 
+# Per-process analyzer used by ProcessPoolExecutor workers
+_worker_analyzer = None
+
+def _init_worker():
+    """Create the worker's analyzer once per process"""
+    global _worker_analyzer
+    _worker_analyzer = IndexAnalyzer()
+
+def _parse_one(query: str) -> Tuple:
+    """Parse a single query in a worker process"""
+    return _worker_analyzer._parse_uncached(query)
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: index_analyzer.py <queries.json>")
@@ -244,8 +360,8 @@ def main():
     queries_file = sys.argv[1]
     
     try:
-        with open(queries_file, 'r') as f:
-            data = json.load(f)
+        with open(queries_file, 'rb') as f:
+            data = json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: File '{queries_file}' not found")
         sys.exit(1)
@@ -266,52 +382,54 @@ def main():
     
     result = analyzer.analyze_queries(queries)
     
-    print("\n" + "="*70)
-    print("INDEX ANALYSIS REPORT")
-    print("="*70 + "\n")
+    # Format the whole report in memory and emit it with a single write
+    out = io.StringIO()
+    
+    print("\n" + "="*70, file=out)
+    print("INDEX ANALYSIS REPORT", file=out)
+    print("="*70 + "\n", file=out)
     
-    print(f"Analyzed {result['total_queries_analyzed']} queries")
-    print(f"Generated {result['total_recommendations']} index recommendations\n")
+    print(f"Analyzed {result['total_queries_analyzed']} queries", file=out)
+    print(f"Generated {result['total_recommendations']} index recommendations\n", file=out)
     
     if result['recommendations']:
-        # Group by priority
-        by_priority = {'critical': [], 'high': [], 'medium': [], 'low': []}
-        for rec in result['recommendations']:
-            priority = rec.get('priority', 'low')
-            by_priority[priority].append(rec)
-        
-        for priority in ['critical', 'high', 'medium', 'low']:
-            recs = by_priority[priority]
-            if not recs:
-                continue
+        # Recommendations are already sorted by priority, so each group is a contiguous run
+        for priority, group in groupby(result['recommendations'], key=attrgetter('priority')):
+            recs = list(group)
             
-            print(f"\n{priority.upper()} PRIORITY ({len(recs)}):")
-            print("-" * 70)
+            print(f"\n{priority.upper()} PRIORITY ({len(recs)}):", file=out)
+            print("-" * 70, file=out)
             
             for rec in recs:
-                print(f"\n  Table: {rec['table']}")
-                print(f"  Index: {rec['index_name']}")
-                print(f"  Columns: {', '.join(rec['columns'])}")
-                print(f"  Reason: {rec['reason']}")
-                print(f"  SQL: {rec['sql']}")
-                if 'note' in rec:
-                    print(f"  Note: {rec['note']}")
-                if 'query_frequency' in rec:
-                    print(f"  Query Frequency: {rec['query_frequency']} executions")
+                lines = [
+                    f"\n  Table: {rec.table}",
+                    f"  Index: {rec.index_name}",
+                    f"  Columns: {', '.join(rec.columns)}",
+                    f"  Reason: {rec.reason}",
+                    f"  SQL: {rec.sql}"
+                ]
+                if rec.note is not None:
+                    lines.append(f"  Note: {rec.note}")
+                if rec.query_frequency is not None:
+                    lines.append(f"  Query Frequency: {rec.query_frequency} executions")
+                out.write('\n'.join(lines) + '\n')
         
-        print("\n" + "="*70)
-        print("IMPLEMENTATION TIPS:")
-        print("="*70)
-        print("  • Critical: Foreign keys - implement immediately")
-        print("  • High: Frequent WHERE clauses - high impact on performance")
-        print("  • Medium: Composite indexes - test impact before deploying")
-        print("  • Low: Nice-to-have optimizations")
-        print("\n  • For PostgreSQL: Use 'CREATE INDEX CONCURRENTLY' to avoid locks")
-        print("  • Test indexes on staging before production")
-        print("  • Monitor query performance before and after")
-        print()
+        print("\n" + "="*70, file=out)
+        print("IMPLEMENTATION TIPS:", file=out)
+        print("="*70, file=out)
+        print("  • Critical: Foreign keys - implement immediately", file=out)
+        print("  • High: Frequent WHERE clauses - high impact on performance", file=out)
+        print("  • Medium: Composite indexes - test impact before deploying", file=out)
+        print("  • Low: Nice-to-have optimizations", file=out)
+        print("\n  • For PostgreSQL: Use 'CREATE INDEX CONCURRENTLY' to avoid locks", file=out)
+        print("  • Test indexes on staging before production", file=out)
+        print("  • Monitor query performance before and after", file=out)
+        print(file=out)
     else:
-        print("✅ No index recommendations - schema appears well-optimized!\n")
+        print("✅ No index recommendations - schema appears well-optimized!\n", file=out)
+    
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
     
     sys.exit(0)
 
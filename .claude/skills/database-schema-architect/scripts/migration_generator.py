@@ -3,10 +3,95 @@
 Migration Generator
 Generates SQL migration scripts with proper structure, rollback, and verification.
 """
+import os
 import sys
 import json
+from contextlib import suppress
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Script boilerplate, built once at import; headers are filled in per run
+MIGRATION_HEADER_TEMPLATE = """-- Migration: {description}
+-- Generated: {date_str}
+-- Author: {author}
+-- Timestamp: {timestamp}
+
+-- This migration script follows best practices:
+-- 1. Wrapped in a transaction for atomicity
+-- 2. Includes verification checks
+-- 3. Has corresponding rollback script
+-- 4. Documents each change clearly
+
+BEGIN;
+
+-- ============================================================================
+-- FORWARD MIGRATION
+-- ============================================================================
+"""
+
+MIGRATION_FOOTER = """
+-- ============================================================================
+-- VERIFICATION
+-- ============================================================================
+
+DO $$
+BEGIN
+    -- Add verification queries here
+    -- Example: Check if table exists
+    -- IF NOT EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = 'new_table') THEN
+    --     RAISE EXCEPTION 'Migration verification failed: table not created';
+    -- END IF;
+    
+    -- Example: Check if column exists
+    -- IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'table' AND column_name = 'column') THEN
+    --     RAISE EXCEPTION 'Migration verification failed: column not created';
+    -- END IF;
+    
+    RAISE NOTICE 'Migration verification passed';
+END $$;
+
+COMMIT;
+
+-- ============================================================================
+-- POST-DEPLOYMENT NOTES
+-- ============================================================================
+-- 1. Run corresponding rollback script if issues occur
+-- 2. Monitor application logs for errors
+-- 3. Check query performance after deployment
+-- 4. Update documentation with schema changes
+"""
+
+ROLLBACK_HEADER_TEMPLATE = """-- Rollback for: {description}
+-- Generated: {date_str}
+
+-- This rollback script reverses all changes from the migration
+-- Apply this if migration causes issues in production
+
+BEGIN;
+
+-- ============================================================================
+-- ROLLBACK OPERATIONS (in reverse order)
+-- ============================================================================
+"""
+
+ROLLBACK_FOOTER = """
+-- ============================================================================
+-- VERIFICATION
+-- ============================================================================
+
+DO $$
+BEGIN
+    RAISE NOTICE 'Rollback completed successfully';
+END $$;
+
+COMMIT;
+"""
 
 def generate_create_table(table: Dict) -> str:
     """Generate CREATE TABLE statement"""
@@ -16,48 +101,50 @@ def generate_create_table(table: Dict) -> str:
     foreign_keys = table.get('foreign_keys', [])
     constraints = table.get('constraints', [])
     
-    sql = f"CREATE TABLE {table_name} (\n"
+    # Collect every definition line, then join once
+    parts = []
     
     # Columns
-    col_definitions = []
     for col in columns:
         col_def = f"    {col['name']} {col['type']}"
+        not_null = col.get('not_null')
+        unique = col.get('unique')
+        default = col.get('default')
         
         # Add constraints inline
-        if col.get('not_null'):
+        if not_null:
             col_def += " NOT NULL"
-        if col.get('unique'):
+        if unique:
             col_def += " UNIQUE"
-        if col.get('default'):
-            col_def += f" DEFAULT {col['default']}"
+        if default:
+            col_def += f" DEFAULT {default}"
         
-        col_definitions.append(col_def)
-    
-    sql += ",\n".join(col_definitions)
+        parts.append(col_def)
     
     # Primary key
     if primary_key:
-        sql += f",\n    PRIMARY KEY ({primary_key})"
+        parts.append(f"    PRIMARY KEY ({primary_key})")
     
     # Foreign keys
     for fk in foreign_keys:
-        fk_name = fk.get('name', f"fk_{table_name}_{fk['column']}")
+        fk_column = fk['column']
+        fk_name = fk.get('name', f"fk_{table_name}_{fk_column}")
         ref_table = fk['ref_table']
-        ref_column = fk.get('ref_column', fk['column'])
+        ref_column = fk.get('ref_column', fk_column)
         on_delete = fk.get('on_delete', 'NO ACTION')
         
-        sql += f",\n    CONSTRAINT {fk_name} FOREIGN KEY ({fk['column']}) "
-        sql += f"REFERENCES {ref_table}({ref_column}) ON DELETE {on_delete}"
+        parts.append(
+            f"    CONSTRAINT {fk_name} FOREIGN KEY ({fk_column}) "
+            f"REFERENCES {ref_table}({ref_column}) ON DELETE {on_delete}"
+        )
     
     # Check constraints
     for constraint in constraints:
         if constraint['type'] == 'CHECK':
             con_name = constraint.get('name', f"ck_{table_name}_{constraint['column']}")
-            sql += f",\n    CONSTRAINT {con_name} CHECK ({constraint['expression']})"
-    
-    sql += "\n);"
+            parts.append(f"    CONSTRAINT {con_name} CHECK ({constraint['expression']})")
     
-    return sql
+    return f"CREATE TABLE {table_name} (\n" + ",\n".join(parts) + "\n);"
 
 def generate_create_index(index: Dict, table_name: str) -> str:
     """Generate CREATE INDEX statement"""
@@ -82,12 +169,15 @@ def generate_create_index(index: Dict, table_name: str) -> str:
 def generate_add_column(table_name: str, column: Dict) -> str:
     """Generate ALTER TABLE ADD COLUMN statement"""
     sql = f"ALTER TABLE {table_name} ADD COLUMN {column['name']} {column['type']}"
+    not_null = column.get('not_null')
+    default = column.get('default')
+    unique = column.get('unique')
     
-    if column.get('not_null'):
+    if not_null:
         sql += " NOT NULL"
-    if column.get('default'):
-        sql += f" DEFAULT {column['default']}"
-    if column.get('unique'):
+    if default:
+        sql += f" DEFAULT {default}"
+    if unique:
         sql += " UNIQUE"
     
     sql += ";"
@@ -102,97 +192,71 @@ def generate_rename_column(table_name: str, old_name: str, new_name: str) -> str
     """Generate ALTER TABLE RENAME COLUMN statement"""
     return f"ALTER TABLE {table_name} RENAME COLUMN {old_name} TO {new_name};"
 
-def generate_migration_header(description: str, author: str = "Database Architect") -> str:
-    """Generate migration file header"""
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    
-    header = f"""-- Migration: {description}
--- Generated: {date_str}
--- Author: {author}
--- Timestamp: {timestamp}
-
--- This migration script follows best practices:
--- 1. Wrapped in a transaction for atomicity
--- 2. Includes verification checks
--- 3. Has corresponding rollback script
--- 4. Documents each change clearly
-
-BEGIN;
-
--- ============================================================================
--- FORWARD MIGRATION
--- ============================================================================
-"""
-    return header
+def generate_migration_header(description: str, author: str = "Database Architect",
+                              generated_at: datetime = None) -> str:
+    """Generate migration file header (generated_at defaults to now)"""
+    generated_at = generated_at or datetime.now()
+    return MIGRATION_HEADER_TEMPLATE.format(
+        description=description,
+        date_str=generated_at.strftime("%Y-%m-%d"),
+        author=author,
+        timestamp=generated_at.strftime("%Y%m%d%H%M%S")
+    )
 
 def generate_migration_footer() -> str:
     """Generate migration file footer with verification"""
-    footer = """
--- ============================================================================
--- VERIFICATION
--- ============================================================================
+    return MIGRATION_FOOTER
 
-DO $$
-BEGIN
-    -- Add verification queries here
-    -- Example: Check if table exists
-    -- IF NOT EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = 'new_table') THEN
-    --     RAISE EXCEPTION 'Migration verification failed: table not created';
-    -- END IF;
-    
-    -- Example: Check if column exists
-    -- IF NOT EXISTS (SELECT 1 FROM information_schema.columns WHERE table_name = 'table' AND column_name = 'column') THEN
-    --     RAISE EXCEPTION 'Migration verification failed: column not created';
-    -- END IF;
-    
-    RAISE NOTICE 'Migration verification passed';
-END $$;
-
-COMMIT;
+def generate_rollback_header(description: str, generated_at: datetime = None) -> str:
+    """Generate rollback script header (generated_at defaults to now)"""
+    return ROLLBACK_HEADER_TEMPLATE.format(
+        description=description,
+        date_str=(generated_at or datetime.now()).strftime("%Y-%m-%d")
+    )
 
--- ============================================================================
--- POST-DEPLOYMENT NOTES
--- ============================================================================
--- 1. Run corresponding rollback script if issues occur
--- 2. Monitor application logs for errors
--- 3. Check query performance after deployment
--- 4. Update documentation with schema changes
-"""
-    return footer
-
-def generate_rollback_header(description: str) -> str:
-    """Generate rollback script header"""
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    
-    header = f"""-- Rollback for: {description}
--- Generated: {date_str}
+def generate_rollback_footer() -> str:
+    """Generate rollback script footer"""
+    return ROLLBACK_FOOTER
 
--- This rollback script reverses all changes from the migration
--- Apply this if migration causes issues in production
+def create_table_op(op: Dict) -> Tuple[str, str]:
+    """Forward and rollback SQL for a create_table operation"""
+    table = op['table']
+    table_name = table['name']
+    return generate_create_table(table), f"DROP TABLE IF EXISTS {table_name} CASCADE;"
 
-BEGIN;
+def create_index_op(op: Dict) -> Tuple[str, str]:
+    """Forward and rollback SQL for a create_index operation"""
+    index = op['index']
+    return generate_create_index(index, op['table']), f"DROP INDEX IF EXISTS {index['name']};"
 
--- ============================================================================
--- ROLLBACK OPERATIONS (in reverse order)
--- ============================================================================
-"""
-    return header
+def add_column_op(op: Dict) -> Tuple[str, str]:
+    """Forward and rollback SQL for an add_column operation"""
+    table_name = op['table']
+    column = op['column']
+    return generate_add_column(table_name, column), generate_drop_column(table_name, column['name'])
 
-def generate_rollback_footer() -> str:
-    """Generate rollback script footer"""
-    return """
--- ============================================================================
--- VERIFICATION
--- ============================================================================
+def drop_column_op(op: Dict) -> Tuple[str, str]:
+    """Forward and rollback SQL for a drop_column operation"""
+    column_name = op['column']
+    return (generate_drop_column(op['table'], column_name),
+            f"-- Manual restoration required for column {column_name}")
 
-DO $$
-BEGIN
-    RAISE NOTICE 'Rollback completed successfully';
-END $$;
+def rename_column_op(op: Dict) -> Tuple[str, str]:
+    """Forward and rollback SQL for a rename_column operation"""
+    table_name = op['table']
+    old_name = op['old_name']
+    new_name = op['new_name']
+    return (generate_rename_column(table_name, old_name, new_name),
+            generate_rename_column(table_name, new_name, old_name))
 
-COMMIT;
-"""
+# Operation type -> handler returning (forward SQL, rollback SQL)
+OP_HANDLERS = {
+    'create_table': create_table_op,
+    'create_index': create_index_op,
+    'add_column': add_column_op,
+    'drop_column': drop_column_op,
+    'rename_column': rename_column_op,
+}
 
 def main():
     if len(sys.argv) < 2:
@@ -233,8 +297,8 @@ def main():
     migration_file = sys.argv[1]
     
     try:
-        with open(migration_file, 'r') as f:
-            data = json.load(f)
+        with open(migration_file, 'rb') as f:
+            data = json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: File '{migration_file}' not found")
         sys.exit(1)
@@ -250,85 +314,63 @@ def main():
         print("Error: No operations defined in migration")
         sys.exit(1)
     
-    # Generate forward migration
-    migration_sql = generate_migration_header(description, author)
-    rollback_operations = []
-    
-    for op in operations:
-        op_type = op.get('type')
-        
-        migration_sql += f"\n-- {op_type.replace('_', ' ').title()}\n"
-        
-        if op_type == 'create_table':
-            table = op['table']
-            table_name = table['name']
-            migration_sql += generate_create_table(table) + "\n"
-            rollback_operations.append(f"DROP TABLE IF EXISTS {table_name} CASCADE;")
-            
-        elif op_type == 'create_index':
-            table_name = op['table']
-            index = op['index']
-            migration_sql += generate_create_index(index, table_name) + "\n"
-            rollback_operations.append(f"DROP INDEX IF EXISTS {index['name']};")
-            
-        elif op_type == 'add_column':
-            table_name = op['table']
-            column = op['column']
-            migration_sql += generate_add_column(table_name, column) + "\n"
-            rollback_operations.append(generate_drop_column(table_name, column['name']))
-            
-        elif op_type == 'drop_column':
-            table_name = op['table']
-            column_name = op['column']
-            migration_sql += generate_drop_column(table_name, column_name) + "\n"
-            rollback_operations.append(f"-- Manual restoration required for column {column_name}")
-            
-        elif op_type == 'rename_column':
-            table_name = op['table']
-            old_name = op['old_name']
-            new_name = op['new_name']
-            migration_sql += generate_rename_column(table_name, old_name, new_name) + "\n"
-            rollback_operations.append(generate_rename_column(table_name, new_name, old_name))
-        
-        else:
-            print(f"Warning: Unknown operation type '{op_type}'")
-    
-    migration_sql += generate_migration_footer()
-    
-    # Generate rollback script
-    rollback_sql = generate_rollback_header(description)
-    rollback_sql += "\n"
-    
-    # Reverse order for rollback
-    for rollback_op in reversed(rollback_operations):
-        rollback_sql += rollback_op + "\n"
-    
-    rollback_sql += generate_rollback_footer()
-    
-    # Output files
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    # One clock reading, so headers and filenames carry the same timestamp
+    generated_at = datetime.now()
+    timestamp = generated_at.strftime("%Y%m%d%H%M%S")
     migration_filename = f"migration_{timestamp}_{description.replace(' ', '_').lower()}.sql"
     rollback_filename = f"rollback_{timestamp}_{description.replace(' ', '_').lower()}.sql"
     
-    with open(migration_filename, 'w') as f:
-        f.write(migration_sql)
-    
-    with open(rollback_filename, 'w') as f:
-        f.write(rollback_sql)
-    
-    print("\n" + "="*70)
-    print("MIGRATION SCRIPTS GENERATED")
-    print("="*70)
-    print(f"\nForward migration: {migration_filename}")
-    print(f"Rollback script:   {rollback_filename}")
-    print("\nNext steps:")
-    print("  1. Review both scripts carefully")
-    print("  2. Test on development database first")
-    print("  3. Run on staging environment")
-    print("  4. Monitor for issues")
-    print("  5. Deploy to production with monitoring")
-    print("  6. Keep rollback script ready")
-    print()
+    # Stream the forward migration to disk as each operation is generated.
+    # Rollback statements are collected because they are written in reverse.
+    rollback_operations = []
+    try:
+        with open(migration_filename, 'w', encoding='utf-8') as out:
+            out.write(generate_migration_header(description, author, generated_at))
+            
+            for op in operations:
+                op_type = op.get('type')
+                
+                out.write(f"\n-- {op_type.replace('_', ' ').title()}\n")
+                
+                handler = OP_HANDLERS.get(op_type)
+                if handler is None:
+                    print(f"Warning: Unknown operation type '{op_type}'")
+                    continue
+                
+                forward_sql, rollback_sql = handler(op)
+                out.write(forward_sql + "\n")
+                rollback_operations.append(rollback_sql)
+            
+            out.write(generate_migration_footer())
+    except BaseException:
+        # Don't leave a truncated migration behind
+        with suppress(FileNotFoundError):
+            os.remove(migration_filename)
+        raise
+    
+    # Write rollback script, in reverse order
+    with open(rollback_filename, 'w', encoding='utf-8') as out:
+        out.write(generate_rollback_header(description, generated_at))
+        out.write("\n")
+        out.writelines(rollback_op + "\n" for rollback_op in reversed(rollback_operations))
+        out.write(generate_rollback_footer())
+    
+    rule = "=" * 70
+    sys.stdout.write(
+        f"\n{rule}\n"
+        "MIGRATION SCRIPTS GENERATED\n"
+        f"{rule}\n"
+        f"\nForward migration: {migration_filename}\n"
+        f"Rollback script:   {rollback_filename}\n"
+        "\nNext steps:\n"
+        "  1. Review both scripts carefully\n"
+        "  2. Test on development database first\n"
+        "  3. Run on staging environment\n"
+        "  4. Monitor for issues\n"
+        "  5. Deploy to production with monitoring\n"
+        "  6. Keep rollback script ready\n"
+        "\n"
+    )
 
 if __name__ == "__main__":
     main()
@@ -6,16 +6,46 @@ Validates database schemas against best practices and common pitfalls.
 import sys
 import re
 import json
+from collections import deque
 from typing import List, Dict, Any, Tuple
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Patterns used inside per-column loops, compiled once
+VARCHAR_SIZE_RE = re.compile(r'VARCHAR\((\d+)\)')
+
+# Column-name and type token checks, each a single C-level scan
+MONEY_NAME_RE = re.compile(r'price|amount|cost')
+FLOAT_TYPE_RE = re.compile(r'FLOAT|REAL|DOUBLE')
+BOOLEAN_PREFIXES = ('is_', 'has_')
+
+def is_snake_identifier(name: str) -> bool:
+    """Equivalent of ^[a-z_][a-z0-9_]*$ using C-level str checks"""
+    # isascii() rejects non-ASCII names before any Unicode table lookup, and
+    # islower() settles the common case without building a lowered copy;
+    # only letterless names like '_1' fall through to the comparison
+    return name.isascii() and name.isidentifier() and (name.islower() or name == name.lower())
+
 class SchemaValidator:
+    __slots__ = ('errors', 'warnings', 'suggestions')
+    
     def __init__(self):
-        self.errors = []
-        self.warnings = []
-        self.suggestions = []
+        # Append-only until the report is built
+        self.errors = deque()
+        self.warnings = deque()
+        self.suggestions = deque()
         
     def validate_naming_convention(self, table_name: str, column_names: List[str]) -> None:
         """Validate naming conventions for tables and columns"""
+        self._validate_table_name(table_name)
+        self._validate_columns(table_name, [{'name': name} for name in column_names], check_types=False)
+    
+    def _validate_table_name(self, table_name: str) -> None:
+        """Validate naming conventions for the table itself"""
         # Check table name (should be lowercase, plural)
         if not table_name.islower():
             self.errors.append(f"Table '{table_name}': Use lowercase names")
@@ -26,16 +56,8 @@ class SchemaValidator:
             self.warnings.append(f"Table '{table_name}': Consider using plural form")
         
         # Check for spaces or special characters
-        if ' ' in table_name or not re.match(r'^[a-z_][a-z0-9_]*$', table_name):
+        if not is_snake_identifier(table_name):
             self.errors.append(f"Table '{table_name}': Use only lowercase letters, numbers, and underscores")
-        
-        # Check column names
-        for col in column_names:
-            if not col.islower():
-                self.errors.append(f"Column '{col}' in '{table_name}': Use lowercase names")
-            
-            if not re.match(r'^[a-z_][a-z0-9_]*$', col):
-                self.errors.append(f"Column '{col}' in '{table_name}': Use only lowercase, numbers, and underscores")
     
     def validate_primary_key(self, table_name: str, pk_column: str = None) -> None:
         """Validate primary key presence and naming"""
@@ -43,77 +65,116 @@ class SchemaValidator:
             self.errors.append(f"Table '{table_name}': Missing primary key")
             return
         
+        if pk_column == 'id':
+            return
+        
         expected_pk = f"{table_name.rstrip('s')}_id"
-        if pk_column != expected_pk and pk_column != 'id':
+        if pk_column != expected_pk:
             self.warnings.append(
                 f"Table '{table_name}': PK is '{pk_column}', consider '{expected_pk}' for consistency"
             )
     
     def validate_foreign_keys(self, table_name: str, foreign_keys: List[Dict]) -> None:
         """Validate foreign key naming and indexing"""
+        # Bind the appends once for the loop
+        add_error = self.errors.append
+        add_warning = self.warnings.append
+        
         for fk in foreign_keys:
             fk_name = fk.get('name')
             fk_column = fk.get('column')
             ref_table = fk.get('ref_table')
             is_indexed = fk.get('indexed', False)
             
-            # Check naming convention
-            expected_fk = f"fk_{table_name}_{fk_column}"
-            if fk_name and fk_name != expected_fk:
-                self.warnings.append(
-                    f"FK '{fk_name}': Consider naming as '{expected_fk}'"
-                )
+            # Check naming convention (only unnamed FKs skip building the name)
+            if fk_name:
+                expected_fk = f"fk_{table_name}_{fk_column}"
+                if fk_name != expected_fk:
+                    add_warning(
+                        f"FK '{fk_name}': Consider naming as '{expected_fk}'"
+                    )
             
             # Check if foreign key column is indexed
             if not is_indexed:
-                self.errors.append(
+                add_error(
                     f"Table '{table_name}': Foreign key '{fk_column}' must be indexed"
                 )
             
             # Check column naming
             if ref_table and not fk_column.endswith('_id'):
-                self.warnings.append(
+                add_warning(
                     f"FK column '{fk_column}' in '{table_name}': Consider ending with '_id'"
                 )
     
     def validate_data_types(self, table_name: str, columns: List[Dict]) -> None:
         """Validate appropriate data type selection"""
+        self._validate_columns(table_name, columns, check_names=False)
+    
+    def _validate_columns(self, table_name: str, columns: List[Dict],
+                          check_names: bool = True, check_types: bool = True) -> None:
+        """Validate column naming and data type selection in one pass"""
+        # Bind pattern methods and appends once instead of resolving them per column
+        money_search = MONEY_NAME_RE.search
+        float_search = FLOAT_TYPE_RE.search
+        varchar_search = VARCHAR_SIZE_RE.search
+        add_error = self.errors.append
+        add_warning = self.warnings.append
+        add_suggestion = self.suggestions.append
+        
         for col in columns:
             col_name = col.get('name')
             data_type = col.get('type', '').upper()
             
+            if check_names:
+                # Check column name; is_snake_identifier() is inlined here so
+                # the islower() result is shared between the two checks
+                is_lower = col_name.islower()
+                if not is_lower:
+                    add_error(f"Column '{col_name}' in '{table_name}': Use lowercase names")
+                
+                if not (col_name.isascii() and col_name.isidentifier()
+                        and (is_lower or col_name == col_name.lower())):
+                    add_error(f"Column '{col_name}' in '{table_name}': Use only lowercase, numbers, and underscores")
+            
+            if not check_types:
+                continue
+            
             # Check for money stored as FLOAT
-            if 'price' in col_name or 'amount' in col_name or 'cost' in col_name:
-                if 'FLOAT' in data_type or 'REAL' in data_type or 'DOUBLE' in data_type:
-                    self.errors.append(
+            if money_search(col_name):
+                if float_search(data_type):
+                    add_error(
                         f"Column '{col_name}' in '{table_name}': Never use FLOAT/DOUBLE for money. Use DECIMAL(10,2)"
                     )
             
             # Check for boolean stored as integer
-            if col_name.startswith('is_') or col_name.startswith('has_'):
+            if col_name.startswith(BOOLEAN_PREFIXES):
                 if 'INT' in data_type and 'BIGINT' not in data_type:
-                    self.warnings.append(
+                    add_warning(
                         f"Column '{col_name}' in '{table_name}': Consider BOOLEAN instead of INTEGER"
                     )
             
             # Check for oversized VARCHAR
             if 'VARCHAR' in data_type:
-                match = re.search(r'VARCHAR\((\d+)\)', data_type)
+                match = varchar_search(data_type)
                 if match:
                     size = int(match.group(1))
                     if size > 255 and 'description' not in col_name and 'comment' not in col_name:
-                        self.warnings.append(
+                        add_warning(
                             f"Column '{col_name}' in '{table_name}': VARCHAR({size}) may be oversized"
                         )
                     if size == 255 and 'email' not in col_name and 'url' not in col_name:
-                        self.suggestions.append(
+                        add_suggestion(
                             f"Column '{col_name}' in '{table_name}': Review if VARCHAR(255) is needed or if smaller size works"
                         )
     
     def validate_indexes(self, table_name: str, indexes: List[Dict]) -> None:
         """Validate index naming and usage"""
+        # Bind the appends once for the loop
+        add_warning = self.warnings.append
+        add_suggestion = self.suggestions.append
+        
         if len(indexes) > 7:
-            self.warnings.append(
+            add_warning(
                 f"Table '{table_name}': Has {len(indexes)} indexes. Too many indexes can slow writes."
             )
         
@@ -122,7 +183,7 @@ class SchemaValidator:
             columns = idx.get('columns', [])
             
             if not idx_name.startswith('idx_'):
-                self.warnings.append(
+                add_warning(
                     f"Index '{idx_name}' in '{table_name}': Should start with 'idx_'"
                 )
             
@@ -130,7 +191,7 @@ class SchemaValidator:
             if len(columns) > 1:
                 expected_name = f"idx_{table_name}_{'_'.join(columns)}"
                 if idx_name != expected_name:
-                    self.suggestions.append(
+                    add_suggestion(
                         f"Composite index '{idx_name}': Consider '{expected_name}' for clarity"
                     )
     
@@ -154,23 +215,21 @@ class SchemaValidator:
                 f"Table '{table_name}': Consider NOT NULL constraints for required fields"
             )
         
-        # Check for numeric columns without CHECK constraints
-        for con in constraints:
-            if 'price' in table_name or 'amount' in table_name:
-                if not has_check:
-                    self.suggestions.append(
-                        f"Table '{table_name}': Consider CHECK constraint for positive values"
-                    )
-                    break
+        # Check for numeric columns without CHECK constraints (only for
+        # tables that declare constraints at all)
+        if constraints and not has_check and ('price' in table_name or 'amount' in table_name):
+            self.suggestions.append(
+                f"Table '{table_name}': Consider CHECK constraint for positive values"
+            )
     
     def generate_report(self) -> Dict[str, Any]:
         """Generate validation report"""
         return {
             "valid": len(self.errors) == 0,
             "total_issues": len(self.errors) + len(self.warnings) + len(self.suggestions),
-            "errors": self.errors,
-            "warnings": self.warnings,
-            "suggestions": self.suggestions
+            "errors": list(self.errors),
+            "warnings": list(self.warnings),
+            "suggestions": list(self.suggestions)
         }
 
 def validate_schema_json(schema_json: Dict) -> Dict[str, Any]:
@@ -214,10 +273,11 @@ def validate_schema_json(schema_json: Dict) -> Dict[str, Any]:
             validator.errors.append("Table missing name")
             continue
         
-        # Validate naming
-        columns = table.get('columns', [])
-        column_names = [col.get('name') for col in columns]
-        validator.validate_naming_convention(table_name, column_names)
+        # Validate table naming
+        validator._validate_table_name(table_name)
+        
+        # Validate column naming and data types
+        validator._validate_columns(table_name, table.get('columns', []))
         
         # Validate primary key
         validator.validate_primary_key(table_name, table.get('primary_key'))
@@ -226,9 +286,6 @@ def validate_schema_json(schema_json: Dict) -> Dict[str, Any]:
         foreign_keys = table.get('foreign_keys', [])
         validator.validate_foreign_keys(table_name, foreign_keys)
         
-        # Validate data types
-        validator.validate_data_types(table_name, columns)
-        
         # Validate indexes
         indexes = table.get('indexes', [])
         validator.validate_indexes(table_name, indexes)
@@ -239,18 +296,49 @@ def validate_schema_json(schema_json: Dict) -> Dict[str, Any]:
     
     return validator.generate_report()
 
+def validate_jsonl_stream(stream_in, stream_out) -> None:
+    """
+    Validate one JSON schema per input line, writing one JSON report per line
+    
+    A bad line gets a {"valid": false, "error": ...} report instead of
+    ending the stream.
+    """
+    for line in stream_in:
+        if not line.strip():
+            continue
+        try:
+            schema = json_loads(line)
+            if not isinstance(schema, dict):
+                report = {"valid": False, "error": f"Expected a JSON object, got {type(schema).__name__}"}
+            else:
+                report = validate_schema_json(schema)
+        except json.JSONDecodeError as e:
+            report = {"valid": False, "error": f"Invalid JSON - {e}"}
+        except Exception as e:
+            # Malformed schema, e.g. a table or column that is not an object
+            report = {"valid": False, "error": f"Invalid schema - {type(e).__name__}: {e}"}
+        stream_out.write(json.dumps(report) + "\n")
+        stream_out.flush()
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: schema_validator.py <schema.json>")
+        print("       schema_validator.py --stdin-jsonl")
         print("\nExpects JSON file with schema definition")
         print("See script header for JSON format specification")
+        print("With --stdin-jsonl, reads one schema per line until EOF and writes one JSON report per line")
         sys.exit(1)
     
     schema_file = sys.argv[1]
     
+    # Long-running mode: reuse one interpreter for many schemas
+    if schema_file == '--stdin-jsonl':
+        validate_jsonl_stream(sys.stdin.buffer, sys.stdout)
+        sys.exit(0)
+    
     try:
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        with open(schema_file, 'rb') as f:
+            schema = json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: File '{schema_file}' not found")
         sys.exit(1)
@@ -264,33 +352,39 @@ def main():
     print("DATABASE SCHEMA VALIDATION REPORT")
     print("="*60 + "\n")
     
-    if report['errors']:
-        print(f"ERRORS ({len(report['errors'])}) - Must fix:")
-        print("-" * 60)
-        for error in report['errors']:
-            print(f"  ❌ {error}")
-        print()
+    errors = report['errors']
+    warnings = report['warnings']
+    suggestions = report['suggestions']
+    n_err = len(errors)
+    n_warn = len(warnings)
+    n_sug = len(suggestions)
+    rule = "-" * 60
+    
+    # One write per severity bucket instead of one print per finding
+    if errors:
+        sys.stdout.write(
+            f"ERRORS ({n_err}) - Must fix:\n{rule}\n"
+            + "".join(f"  ❌ {error}\n" for error in errors) + "\n"
+        )
     
-    if report['warnings']:
-        print(f"WARNINGS ({len(report['warnings'])}) - Should fix:")
-        print("-" * 60)
-        for warning in report['warnings']:
-            print(f"  ⚠️  {warning}")
-        print()
+    if warnings:
+        sys.stdout.write(
+            f"WARNINGS ({n_warn}) - Should fix:\n{rule}\n"
+            + "".join(f"  ⚠️  {warning}\n" for warning in warnings) + "\n"
+        )
     
-    if report['suggestions']:
-        print(f"SUGGESTIONS ({len(report['suggestions'])}) - Consider:")
-        print("-" * 60)
-        for suggestion in report['suggestions']:
-            print(f"  💡 {suggestion}")
-        print()
+    if suggestions:
+        sys.stdout.write(
+            f"SUGGESTIONS ({n_sug}) - Consider:\n{rule}\n"
+            + "".join(f"  💡 {suggestion}\n" for suggestion in suggestions) + "\n"
+        )
     
-    if report['valid'] and not report['warnings'] and not report['suggestions']:
+    if report['valid'] and not warnings and not suggestions:
         print("✅ Schema validation passed with no issues!\n")
     elif report['valid']:
-        print(f"✅ Schema validation passed with {len(report['warnings']) + len(report['suggestions'])} recommendations\n")
+        print(f"✅ Schema validation passed with {n_warn + n_sug} recommendations\n")
     else:
-        print(f"❌ Schema validation failed with {len(report['errors'])} errors\n")
+        print(f"❌ Schema validation failed with {n_err} errors\n")
     
     sys.exit(0 if report['valid'] else 1)
 
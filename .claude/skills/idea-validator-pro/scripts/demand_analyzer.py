@@ -7,179 +7,139 @@ import sys
 import json
 from datetime import datetime
 
-def analyze_demand_signals(idea_name, keywords):
-    """
-    Analyze demand signals for a product idea
-    
-    Args:
-        idea_name: Name of the product idea
-        keywords: List of keywords related to the idea
-    
-    Returns:
-        dict: Analysis results with demand signals
-    """
-    
-    results = {
-        "idea": idea_name,
-        "analysis_date": datetime.now().isoformat(),
-        "keywords_analyzed": keywords,
-        "demand_score": 0,
-        "signals": [],
-        "recommendations": []
-    }
-    
-    # This is a template structure
-    # In a real implementation, this would:
-    # 1. Check Google Trends API for search volume trends
-    # 2. Analyze Reddit discussions via API
-    # 3. Check Twitter sentiment
-    # 4. Scan Product Hunt for similar products
-    # 5. Analyze competitor review patterns
-    
-    print("\n" + "="*60)
-    print(f"DEMAND SIGNAL ANALYSIS: {idea_name}")
-    print("="*60 + "\n")
-    
-    # Example structure for demand signals
-    signal_template = {
-        "search_trends": {
-            "status": "NEEDS_MANUAL_CHECK",
-            "instruction": f"Check Google Trends for: {', '.join(keywords)}",
-            "what_to_look_for": [
-                "Is the trend rising, stable, or declining?",
-                "What's the search volume relative to related terms?",
-                "Are there seasonal patterns?",
-                "What related queries show up?"
-            ]
-        },
-        "community_discussions": {
-            "status": "NEEDS_MANUAL_CHECK",
-            "sources": [
-                f"Reddit: site:reddit.com {keywords[0]} problem",
-                f"Twitter: '{keywords[0]}' -filter:retweets",
-                f"Indie Hackers: Search for '{keywords[0]}'"
-            ],
-            "what_to_look_for": [
-                "Number of discussions in last 30 days",
-                "Sentiment (positive/negative/neutral)",
-                "Specific pain points mentioned",
-                "Workarounds people are using",
-                "Willingness to pay signals"
-            ]
-        },
-        "competitor_analysis": {
-            "status": "NEEDS_MANUAL_CHECK",
-            "actions": [
-                f"Search Product Hunt for: {keywords[0]}",
-                f"Search G2.com for: {keywords[0]} software",
-                "List top 5 competitors",
-                "Check their review ratings",
-                "Identify gaps in their offerings"
-            ]
-        },
-        "market_validation": {
-            "status": "NEEDS_MANUAL_CHECK",
-            "questions": [
-                "Are there existing products people pay for?",
-                "What's the typical pricing range?",
-                "How mature is the market?",
-                "Are new products launching in this space?",
-                "What's the competitive intensity?"
-            ]
-        }
+# Section banners and static report blocks, rendered once at import
+RULE = "=" * 60
+
+def banner(title):
+    """Render a section banner as printed by the original per-line prints"""
+    return f"\n{RULE}\n{title}\n{RULE}\n\n"
+
+# Demand signal checklist; {keywords_csv} and {keyword} are filled in per idea
+SIGNAL_CHECKLIST = {
+    "search_trends": {
+        "status": "NEEDS_MANUAL_CHECK",
+        "instruction": "Check Google Trends for: {keywords_csv}",
+        "what_to_look_for": [
+            "Is the trend rising, stable, or declining?",
+            "What's the search volume relative to related terms?",
+            "Are there seasonal patterns?",
+            "What related queries show up?"
+        ]
+    },
+    "community_discussions": {
+        "status": "NEEDS_MANUAL_CHECK",
+        "sources": [
+            "Reddit: site:reddit.com {keyword} problem",
+            "Twitter: '{keyword}' -filter:retweets",
+            "Indie Hackers: Search for '{keyword}'"
+        ],
+        "what_to_look_for": [
+            "Number of discussions in last 30 days",
+            "Sentiment (positive/negative/neutral)",
+            "Specific pain points mentioned",
+            "Workarounds people are using",
+            "Willingness to pay signals"
+        ]
+    },
+    "competitor_analysis": {
+        "status": "NEEDS_MANUAL_CHECK",
+        "actions": [
+            "Search Product Hunt for: {keyword}",
+            "Search G2.com for: {keyword} software",
+            "List top 5 competitors",
+            "Check their review ratings",
+            "Identify gaps in their offerings"
+        ]
+    },
+    "market_validation": {
+        "status": "NEEDS_MANUAL_CHECK",
+        "questions": [
+            "Are there existing products people pay for?",
+            "What's the typical pricing range?",
+            "How mature is the market?",
+            "Are new products launching in this space?",
+            "What's the competitive intensity?"
+        ]
     }
-    
-    print("📊 SIGNAL CHECKLIST\n")
-    print("Follow these steps to validate demand:\n")
-    
-    step = 1
-    for signal_type, details in signal_template.items():
-        print(f"{step}. {signal_type.replace('_', ' ').title()}")
-        print(f"   Status: {details['status']}\n")
+}
+
+# List sections of each signal, in display order, with their headings
+SIGNAL_SECTIONS = (
+    ('sources', "   🔍 Check these sources:"),
+    ('actions', "   ✓ Actions:"),
+    ('questions', "   ❓ Questions to answer:"),
+    ('what_to_look_for', "   👀 What to look for:"),
+)
+
+def render_checklist(signals):
+    """Render the signal checklist as a str.format template"""
+    lines = ["📊 SIGNAL CHECKLIST\n", "Follow these steps to validate demand:\n"]
+    for step, (signal_type, details) in enumerate(signals.items(), 1):
+        lines.append(f"{step}. {signal_type.replace('_', ' ').title()}")
+        lines.append(f"   Status: {details['status']}\n")
         
         if 'instruction' in details:
-            print(f"   📍 {details['instruction']}")
-        
-        if 'sources' in details:
-            print("   🔍 Check these sources:")
-            for source in details['sources']:
-                print(f"      • {source}")
-        
-        if 'actions' in details:
-            print("   ✓ Actions:")
-            for action in details['actions']:
-                print(f"      • {action}")
+            lines.append(f"   📍 {details['instruction']}")
         
-        if 'questions' in details:
-            print("   ❓ Questions to answer:")
-            for question in details['questions']:
-                print(f"      • {question}")
+        for key, heading in SIGNAL_SECTIONS:
+            if key in details:
+                lines.append(heading)
+                lines.extend(f"      • {item}" for item in details[key])
         
-        if 'what_to_look_for' in details:
-            print("   👀 What to look for:")
-            for item in details['what_to_look_for']:
-                print(f"      • {item}")
-        
-        print()
-        step += 1
-    
-    print("\n" + "="*60)
-    print("DEMAND SCORING FRAMEWORK")
-    print("="*60 + "\n")
-    
-    scoring_criteria = {
-        "Strong Demand (7-10 points)": [
-            "Rising Google Trends over 12+ months",
-            "50+ Reddit discussions in last month",
-            "Active Twitter conversations daily",
-            "Multiple competitors successfully monetizing",
-            "Clear willingness to pay signals",
-            "Specific, recurring pain points mentioned"
-        ],
-        "Moderate Demand (4-6 points)": [
-            "Stable Google Trends",
-            "10-50 Reddit discussions monthly",
-            "Occasional Twitter mentions",
-            "A few competitors exist",
-            "Some evidence of payment willingness",
-            "Pain point exists but not severe"
-        ],
-        "Weak Demand (1-3 points)": [
-            "Declining or flat Google Trends",
-            "<10 Reddit discussions monthly",
-            "Rare Twitter mentions",
-            "No or many failed competitors",
-            "No clear willingness to pay",
-            "Problem not frequently mentioned"
-        ]
-    }
-    
-    for category, indicators in scoring_criteria.items():
-        print(f"{category}:")
-        for indicator in indicators:
-            print(f"  ✓ {indicator}")
-        print()
-    
-    print("\n" + "="*60)
-    print("RESEARCH TEMPLATE")
-    print("="*60 + "\n")
-    
-    template = f"""
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+SIGNAL_CHECKLIST_TEMPLATE = render_checklist(SIGNAL_CHECKLIST)
+
+SCORING_CRITERIA = {
+    "Strong Demand (7-10 points)": [
+        "Rising Google Trends over 12+ months",
+        "50+ Reddit discussions in last month",
+        "Active Twitter conversations daily",
+        "Multiple competitors successfully monetizing",
+        "Clear willingness to pay signals",
+        "Specific, recurring pain points mentioned"
+    ],
+    "Moderate Demand (4-6 points)": [
+        "Stable Google Trends",
+        "10-50 Reddit discussions monthly",
+        "Occasional Twitter mentions",
+        "A few competitors exist",
+        "Some evidence of payment willingness",
+        "Pain point exists but not severe"
+    ],
+    "Weak Demand (1-3 points)": [
+        "Declining or flat Google Trends",
+        "<10 Reddit discussions monthly",
+        "Rare Twitter mentions",
+        "No or many failed competitors",
+        "No clear willingness to pay",
+        "Problem not frequently mentioned"
+    ]
+}
+
+SCORING_REPORT_TEXT = banner("DEMAND SCORING FRAMEWORK") + "".join(
+    f"{category}:\n" + "".join(f"  ✓ {indicator}\n" for indicator in indicators) + "\n"
+    for category, indicators in SCORING_CRITERIA.items()
+)
+
+# Research log skeleton; filled in once per idea with str.format_map
+RESEARCH_TEMPLATE = """
 # Demand Research Log: {idea_name}
-Date: {datetime.now().strftime('%Y-%m-%d')}
+Date: {date}
 
 ## Keywords Analyzed
-{', '.join(keywords)}
+{keywords_csv}
 
 ## Google Trends
-URL: https://trends.google.com/trends/explore?q={keywords[0].replace(' ', '+')}
+URL: https://trends.google.com/trends/explore?q={keyword_query}
 - Trend Direction: [Rising / Stable / Declining]
 - Absolute Volume: [High / Medium / Low]
 - Time Period: Last 5 years
 - Key Observation: [Your notes]
 
 ## Reddit Research
-Search: site:reddit.com {keywords[0]}
+Search: site:reddit.com {keyword}
 - Total Discussions Found: [Number]
 - Recent Activity (30 days): [Number]
 - Key Subreddits: [List]
@@ -189,7 +149,7 @@ Search: site:reddit.com {keywords[0]}
   3. [Pain point 3]
 
 ## Twitter Research
-Search: '{keywords[0]}' -filter:retweets
+Search: '{keyword}' -filter:retweets
 - Daily Mentions: [Estimate]
 - Sentiment: [Positive / Neutral / Negative]
 - Key Themes: [List themes]
@@ -214,42 +174,99 @@ Justification:
 1. [Action 1]
 2. [Action 2]
 """
+
+TIPS = [
+    "Spend 30-60 minutes on research, not hours",
+    "Look for patterns, not single data points",
+    "Check dates - old discussions may not reflect current market",
+    "Follow the money - evidence people pay is most important",
+    "Be skeptical - filter out hype and self-promotion",
+    "Document sources - you'll want to reference them later",
+    "Compare to similar successful products",
+    "Ask 'why' - dig deeper than surface complaints"
+]
+
+TIPS_TEXT = banner("💡 PRO TIPS") + "".join(f"{i}. {tip}\n" for i, tip in enumerate(TIPS, 1))
+
+def analyze_demand_signals(idea_name, keywords, quiet=False):
+    """
+    Analyze demand signals for a product idea
     
-    print(template)
+    Args:
+        idea_name: Name of the product idea
+        keywords: List of keywords related to the idea
+        quiet: Skip the printed checklist and only return the results
     
-    print("\n" + "="*60)
-    print("💡 PRO TIPS")
-    print("="*60 + "\n")
+    Returns:
+        dict: Analysis results with demand signals
+    """
     
-    tips = [
-        "Spend 30-60 minutes on research, not hours",
-        "Look for patterns, not single data points",
-        "Check dates - old discussions may not reflect current market",
-        "Follow the money - evidence people pay is most important",
-        "Be skeptical - filter out hype and self-promotion",
-        "Document sources - you'll want to reference them later",
-        "Compare to similar successful products",
-        "Ask 'why' - dig deeper than surface complaints"
-    ]
+    results = {
+        "idea": idea_name,
+        "analysis_date": datetime.now().isoformat(),
+        "keywords_analyzed": keywords,
+        "demand_score": 0,
+        "signals": [],
+        "recommendations": []
+    }
     
-    for i, tip in enumerate(tips, 1):
-        print(f"{i}. {tip}")
+    # This is a template structure
+    # In a real implementation, this would:
+    # 1. Check Google Trends API for search volume trends
+    # 2. Analyze Reddit discussions via API
+    # 3. Check Twitter sentiment
+    # 4. Scan Product Hunt for similar products
+    # 5. Analyze competitor review patterns
+    
+    if quiet:
+        return results
+    
+    sys.stdout.write(banner(f"DEMAND SIGNAL ANALYSIS: {idea_name}"))
+    
+    # Only the keyword-dependent lines are formatted per call
+    keywords_csv = ', '.join(keywords)
+    sys.stdout.write(SIGNAL_CHECKLIST_TEMPLATE.format(
+        keywords_csv=keywords_csv,
+        keyword=keywords[0]
+    ))
+    
+    sys.stdout.write(SCORING_REPORT_TEXT)
+    
+    sys.stdout.write(banner("RESEARCH TEMPLATE") + RESEARCH_TEMPLATE.format_map({
+        'idea_name': idea_name,
+        'date': datetime.now().strftime('%Y-%m-%d'),
+        'keywords_csv': keywords_csv,
+        'keyword': keywords[0],
+        'keyword_query': keywords[0].replace(' ', '+')
+    }) + "\n")
+    
+    sys.stdout.write(TIPS_TEXT)
     
     return results
 
 def main():
     """Main execution function"""
     
-    if len(sys.argv) < 2:
-        print("Usage: python demand_analyzer.py 'Your Idea Name' [keyword1] [keyword2] ...")
+    args = sys.argv[1:]
+    quiet = '--quiet' in args
+    if quiet:
+        args = [arg for arg in args if arg != '--quiet']
+    
+    if not args:
+        print("Usage: python demand_analyzer.py 'Your Idea Name' [keyword1] [keyword2] ... [--quiet]")
         print("\nExample:")
         print("  python demand_analyzer.py 'Invoice Generator' invoice invoicing billing")
+        print("\n--quiet prints only the analysis results as JSON")
         sys.exit(1)
     
-    idea_name = sys.argv[1]
-    keywords = sys.argv[2:] if len(sys.argv) > 2 else [idea_name.lower()]
+    idea_name = args[0]
+    keywords = args[1:] if len(args) > 1 else [idea_name.lower()]
+    
+    results = analyze_demand_signals(idea_name, keywords, quiet=quiet)
     
-    results = analyze_demand_signals(idea_name, keywords)
+    if quiet:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
     
     print("\n" + "="*60)
     print("✅ CHECKLIST COMPLETE")
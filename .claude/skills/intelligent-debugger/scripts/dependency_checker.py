@@ -15,7 +15,7 @@ Supports:
 - General dependency verification
 
 Usage:
-    python dependency_checker.py [--type python|node] [--check-updates]
+    python dependency_checker.py [--type python|node] [--check-updates] [--no-cache]
 """
 
 import sys
@@ -25,22 +25,213 @@ import os
 import re
 from pathlib import Path
 import argparse
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Tuple, Optional
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Installed-distribution metadata is read in-process instead of via 'pip show'
+try:
+    from importlib.metadata import distributions
+except ImportError:  # Python < 3.8
+    distributions = None
+
+# packaging parses full PEP 508 requirement lines (extras, markers, URLs)
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError:
+    Requirement = None
+
+try:
+    from packaging.specifiers import InvalidSpecifier, SpecifierSet
+except ImportError:
+    SpecifierSet = None
+
+def canonicalize_name(name: str) -> str:
+    """PEP 503 normalized project name, without a regex pass"""
+    name = name.lower().replace('_', '-').replace('.', '-')
+    # Separator runs such as 'a._b' are rare; collapse them only when present
+    while '--' in name:
+        name = name.replace('--', '-')
+    return name
+
+# Streams pip's JSON output incrementally when installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Fallback requirements-line parser when packaging is not installed
+REQUIREMENT_RE = re.compile(r'([a-zA-Z0-9_-]+)(==|>=|<=|>|<|~=)?(.+)?')
+
+# Concurrent 'pip show' processes when installed metadata can't be read in-process
+PIP_SHOW_WORKERS = 16
+
+# Marker files for project type detection, checked in order
+NODE_PROJECT_FILES = ('package.json', 'package-lock.json', 'yarn.lock')
+PYTHON_PROJECT_FILES = ('requirements.txt', 'pyproject.toml', 'Pipfile', 'setup.py')
+
+# Python check results, keyed by requirements contents and environment
+CACHE_DIR = Path.home() / '.cache' / 'depcheck'
+CACHED_RESULT_KEYS = ('missing', 'installed', 'conflicts')
+
+# Entries shown per list section of the report before "... and N more"
+REPORT_LIST_LIMIT = 10
+
+# Seconds allowed for an outdated-packages query
+OUTDATED_TIMEOUT = 30
+
+@lru_cache(maxsize=None)
+def parse_requirements_file(filename: str, mtime: float) -> Dict[str, Optional[str]]:
+    """Parse a requirements.txt; mtime is part of the cache key so edits re-parse"""
+    dependencies = {}
+    with open(filename, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                parsed = parse_requirement_line(line)
+                if parsed:
+                    package, version_spec = parsed
+                    dependencies[package] = version_spec
+    return dependencies
+
+def parse_requirement_line(line: str) -> Optional[Tuple[str, Optional[str]]]:
+    """(package, version spec) for one requirements line, or None to skip it"""
+    if Requirement is None:
+        # Parse package==version or package>=version
+        match = REQUIREMENT_RE.match(line)
+        if not match:
+            return None
+        package, operator, version = match.groups()
+        return package, f"{operator}{version}" if operator else None
+    
+    # Options (-r, -e, --index-url) are not requirements; drop inline comments
+    try:
+        req = Requirement(line.split(' #', 1)[0])
+    except InvalidRequirement:
+        return None
+    
+    # Requirements whose environment marker excludes this interpreter aren't needed
+    if req.marker is not None and not req.marker.evaluate():
+        return None
+    return req.name, str(req.specifier) or None
+
+def load_json_items(stream) -> List:
+    """Items of a top-level JSON array read from a binary stream"""
+    if ijson is not None:
+        return list(ijson.items(stream, 'item'))
+    data = stream.read()
+    return json_loads(data) if data else []
+
+@lru_cache(maxsize=None)
+def specifier_set(spec: str) -> 'SpecifierSet':
+    """Parsed SpecifierSet for a version spec, built once per distinct spec"""
+    return SpecifierSet(spec)
+
+def sys_path_key() -> Tuple[Tuple[str, int], ...]:
+    """sys.path entries with their mtimes; installs and removals change it"""
+    key = []
+    for entry in sys.path:
+        try:
+            key.append((entry, os.stat(entry or '.').st_mtime_ns))
+        except OSError:
+            pass
+    return tuple(key)
+
+@lru_cache(maxsize=1)
+def installed_python_versions(path_key: Tuple[Tuple[str, int], ...]) -> Dict[str, str]:
+    """Map canonical name -> version for every installed distribution"""
+    installed = {}
+    for dist in distributions():
+        name = dist.metadata['Name']
+        # First match on sys.path wins, as with pip
+        if name:
+            installed.setdefault(canonicalize_name(name), dist.version)
+    return installed
+
+@lru_cache(maxsize=None)
+def pip_show_version(package: str, path_key: Tuple[Tuple[str, int], ...]) -> Optional[str]:
+    """Installed version of a package according to 'pip show' (path_key as above)"""
+    try:
+        result = subprocess.run(
+            [sys.executable, '-m', 'pip', 'show', package],
+            capture_output=True
+        )
+        if result.returncode == 0:
+            # Only the Version line is decoded
+            for line in result.stdout.splitlines():
+                if line.startswith(b'Version:'):
+                    return line.split(b':', 1)[1].strip().decode()
+    except:
+        pass
+    return None
+
+def run_in_background(fn) -> Future:
+    """Start fn on its own worker thread and return its future"""
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(fn)
+    finally:
+        executor.shutdown(wait=False)
+
+def results_cache_key(req_bytes: bytes, path_key: Tuple[Tuple[str, int], ...]) -> str:
+    """Digest of everything a Python check result depends on"""
+    digest = hashlib.blake2b(req_bytes, digest_size=16)
+    for part in (sys.version, sys.executable, sys.platform, repr(path_key),
+                 str(Requirement is not None), str(SpecifierSet is not None)):
+        digest.update(b'\0' + part.encode())
+    return digest.hexdigest()
+
+def load_cached_results(path: Optional[Path]) -> Optional[Dict]:
+    """Load cached Python check results, if any"""
+    if path is None:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def store_cached_results(path: Optional[Path], results: Dict) -> None:
+    """Persist Python check results for the next run"""
+    if path is None:
+        return
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(results, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        with suppress(OSError):
+            os.remove(tmp_path)
+
 class DependencyChecker:
-    def __init__(self, check_type: str = 'auto', check_updates: bool = False):
+    def __init__(self, check_type: str = 'auto', check_updates: bool = False,
+                 cache_dir=CACHE_DIR):
         self.check_type = check_type
         self.check_updates = check_updates
+        self.cache_dir = cache_dir
         self.issues = []
         self.warnings = []
+        self._installed = None
+        self._path_key = ()
         
     def detect_project_type(self) -> str:
         """Auto-detect project type based on files present"""
-        files_present = os.listdir('.')
-        
-        if any(f in files_present for f in ['package.json', 'package-lock.json', 'yarn.lock']):
+        # A few stat probes instead of listing the whole directory
+        if any(os.path.exists(f) for f in NODE_PROJECT_FILES):
             return 'node'
-        elif any(f in files_present for f in ['requirements.txt', 'pyproject.toml', 'Pipfile', 'setup.py']):
+        elif any(os.path.exists(f) for f in PYTHON_PROJECT_FILES):
             return 'python'
         else:
             return 'unknown'
@@ -72,40 +263,89 @@ class DependencyChecker:
         
         print(f"📄 Found: {req_file}\n")
         
+        # Start the outdated query now so the local work below overlaps pip's wait
+        pending_outdated = None
+        if self.check_updates:
+            pending_outdated = run_in_background(self._check_outdated_python)
+        
+        # Results for an unchanged requirements file and environment are reused
+        self._path_key = sys_path_key()
+        cache_file = self._results_cache_file(req_file)
+        cached = load_cached_results(cache_file)
+        if cached is not None:
+            results.update(cached)
+        else:
+            issues_before = len(self.issues)
+            self._classify_python_dependencies(req_file, results)
+            if len(self.issues) == issues_before:
+                store_cached_results(cache_file, {key: results[key] for key in CACHED_RESULT_KEYS})
+        
+        # Check for outdated packages if requested
+        if self.check_updates:
+            print("🔍 Checking for outdated packages...\n")
+            outdated = pending_outdated.result()
+            results['outdated'] = outdated
+        
+        return results
+    
+    def _classify_python_dependencies(self, req_file: str, results: Dict) -> None:
+        """Fill results' missing/installed/conflicts lists for a requirements file"""
         # Parse requirements
         dependencies = self._parse_requirements(req_file)
         
-        # Check each dependency
+        # Snapshot installed versions once; lookups below are dict hits
+        self._installed = self._snapshot_installed_python()
+        
+        # Without a snapshot each lookup is a 'pip show' process; run them concurrently
+        installed = self._installed
+        if installed is None:
+            with ThreadPoolExecutor(max_workers=min(PIP_SHOW_WORKERS, len(dependencies) or 1)) as executor:
+                versions = executor.map(self._get_installed_version_python, dependencies)
+                installed = {
+                    canonicalize_name(package): version
+                    for package, version in zip(dependencies, versions, strict=True) if version
+                }
+        
+        # Classify with one set difference instead of a lookup per branch
+        canonical = {package: canonicalize_name(package) for package in dependencies}
+        missing_names = set(canonical.values()) - installed.keys()
+        results['missing'] = [
+            {'name': package, 'required': version_spec}
+            for package, version_spec in dependencies.items()
+            if canonical[package] in missing_names
+        ]
+        
+        # Check each installed dependency
         for package, version_spec in dependencies.items():
-            installed_version = self._get_installed_version_python(package)
+            key = canonical[package]
+            if key in missing_names:
+                continue
             
-            if installed_version:
-                results['installed'].append({
-                    'name': package,
-                    'version': installed_version,
-                    'required': version_spec
-                })
-                
-                # Check version compatibility
-                if version_spec and not self._version_matches(installed_version, version_spec):
-                    results['conflicts'].append({
-                        'name': package,
-                        'installed': installed_version,
-                        'required': version_spec
-                    })
-            else:
-                results['missing'].append({
+            installed_version = installed[key]
+            results['installed'].append({
+                'name': package,
+                'version': installed_version,
+                'required': version_spec
+            })
+            
+            # Check version compatibility
+            if version_spec and not self._version_matches(installed_version, version_spec):
+                results['conflicts'].append({
                     'name': package,
+                    'installed': installed_version,
                     'required': version_spec
                 })
-        
-        # Check for outdated packages if requested
-        if self.check_updates:
-            print("🔍 Checking for outdated packages...\n")
-            outdated = self._check_outdated_python()
-            results['outdated'] = outdated
-        
-        return results
+    
+    def _results_cache_file(self, req_file: str) -> Optional[Path]:
+        """Cache entry for req_file's results in this environment, if caching is on"""
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(req_file, 'rb') as f:
+                req_bytes = f.read()
+        except OSError:
+            return None
+        return Path(self.cache_dir) / f"{results_cache_key(req_bytes, self._path_key)}.json"
     
     def check_node_dependencies(self) -> Dict:
         """Check Node.js project dependencies"""
@@ -128,11 +368,11 @@ class DependencyChecker:
         
         # Parse package.json
         try:
-            with open('package.json', 'r') as f:
-                package_data = json.load(f)
+            with open('package.json', 'rb') as f:
+                package_data = json_loads(f.read())
                 dependencies = package_data.get('dependencies', {})
                 dev_dependencies = package_data.get('devDependencies', {})
-                all_deps = {**dependencies, **dev_dependencies}
+                all_deps = dependencies | dev_dependencies
         except Exception as e:
             self.issues.append(f"Failed to parse package.json: {e}")
             return results
@@ -147,13 +387,18 @@ class DependencyChecker:
                 })
             return results
         
+        # Launch 'npm outdated' now so its Node startup overlaps 'npm list'
+        pending_outdated = None
+        if self.check_updates:
+            pending_outdated = run_in_background(self._run_npm_outdated)
+        
         # Use npm list to check installed packages
         try:
             cmd = ['npm', 'list', '--json', '--depth=0']
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(cmd, capture_output=True)
             
             if result.stdout:
-                installed_data = json.loads(result.stdout)
+                installed_data = json_loads(result.stdout)
                 installed_deps = installed_data.get('dependencies', {})
                 
                 # Check each required dependency
@@ -192,53 +437,46 @@ class DependencyChecker:
         # Check for outdated packages
         if self.check_updates:
             print("🔍 Checking for outdated packages...\n")
-            outdated = self._check_outdated_node()
+            outdated = self._check_outdated_node(pending_outdated)
             results['outdated'] = outdated
         
         return results
     
     def _parse_requirements(self, filename: str) -> Dict[str, str]:
         """Parse Python requirements file"""
-        dependencies = {}
-        
         if filename == 'requirements.txt':
             try:
-                with open(filename, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            # Parse package==version or package>=version
-                            match = re.match(r'([a-zA-Z0-9_-]+)(==|>=|<=|>|<|~=)?(.+)?', line)
-                            if match:
-                                package, operator, version = match.groups()
-                                version_spec = f"{operator}{version}" if operator else None
-                                dependencies[package] = version_spec
+                path = os.path.abspath(filename)
+                return dict(parse_requirements_file(path, os.path.getmtime(path)))
             except Exception as e:
                 self.issues.append(f"Failed to parse {filename}: {e}")
         
-        return dependencies
+        return {}
+    
+    def _snapshot_installed_python(self) -> Optional[Dict[str, str]]:
+        """Map canonical name -> version for every installed distribution"""
+        if distributions is None:
+            return None
+        return installed_python_versions(self._path_key)
     
     def _get_installed_version_python(self, package: str) -> Optional[str]:
         """Get installed version of a Python package"""
-        try:
-            result = subprocess.run(
-                [sys.executable, '-m', 'pip', 'show', package],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if line.startswith('Version:'):
-                        return line.split(':', 1)[1].strip()
-        except:
-            pass
-        return None
+        if self._installed is not None:
+            return self._installed.get(canonicalize_name(package))
+        
+        return pip_show_version(package, self._path_key)
     
     def _version_matches(self, installed: str, required: str) -> bool:
-        """Check if installed version matches requirement (simplified)"""
+        """Check if installed version matches requirement"""
         if not required:
             return True
         
+        if SpecifierSet is not None:
+            try:
+                return specifier_set(required).contains(installed, prereleases=True)
+            except InvalidSpecifier:
+                pass  # Fall back to the simplified check below
+        
         # Handle == operator
         if required.startswith('=='):
             return installed == required[2:]
@@ -259,31 +497,49 @@ class DependencyChecker:
         """Check for outdated Python packages"""
         outdated = []
         try:
-            result = subprocess.run(
+            with subprocess.Popen(
                 [sys.executable, '-m', 'pip', 'list', '--outdated', '--format=json'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0 and result.stdout:
-                outdated = json.loads(result.stdout)
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            ) as proc:
+                # Parse the JSON as pip writes it; the timer enforces the time limit
+                timed_out = threading.Event()
+                
+                def kill_on_timeout():
+                    timed_out.set()
+                    proc.kill()
+                
+                timer = threading.Timer(OUTDATED_TIMEOUT, kill_on_timeout)
+                timer.start()
+                try:
+                    items = load_json_items(proc.stdout)
+                finally:
+                    timer.cancel()
+            
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(proc.args, OUTDATED_TIMEOUT)
+            if proc.returncode == 0:
+                outdated = items
         except:
             self.warnings.append("Failed to check for outdated packages")
         
         return outdated
     
-    def _check_outdated_node(self) -> List[Dict]:
-        """Check for outdated Node.js packages"""
+    def _run_npm_outdated(self) -> subprocess.CompletedProcess:
+        """Run 'npm outdated --json' and return the completed process"""
+        return subprocess.run(
+            ['npm', 'outdated', '--json'],
+            capture_output=True,
+            timeout=OUTDATED_TIMEOUT
+        )
+    
+    def _check_outdated_node(self, pending=None) -> List[Dict]:
+        """Check for outdated Node.js packages (pending: future from _run_npm_outdated)"""
         outdated = []
         try:
-            result = subprocess.run(
-                ['npm', 'outdated', '--json'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = pending.result() if pending is not None else self._run_npm_outdated()
             if result.stdout:
-                outdated_data = json.loads(result.stdout)
+                outdated_data = json_loads(result.stdout)
                 for package, info in outdated_data.items():
                     outdated.append({
                         'name': package,
@@ -298,96 +554,100 @@ class DependencyChecker:
     
     def print_report(self, results: Dict):
         """Print dependency check report"""
-        print("\n" + "="*80)
-        print(f"DEPENDENCY CHECK REPORT - {results['type'].upper()}")
-        print("="*80 + "\n")
+        # Collect every line, then write the report once
+        lines = []
+        lines.append("\n" + "="*80)
+        lines.append(f"DEPENDENCY CHECK REPORT - {results['type'].upper()}")
+        lines.append("="*80 + "\n")
         
         # Missing Dependencies
         if results['missing']:
-            print(f"❌ MISSING DEPENDENCIES ({len(results['missing'])}):")
+            lines.append(f"❌ MISSING DEPENDENCIES ({len(results['missing'])}):")
             for dep in results['missing']:
                 req = dep.get('required', 'any version')
-                print(f"  • {dep['name']} ({req})")
-            print()
+                lines.append(f"  • {dep['name']} ({req})")
+            lines.append("")
         else:
-            print("✅ All required dependencies are installed\n")
+            lines.append("✅ All required dependencies are installed\n")
         
         # Version Conflicts
         if results['conflicts']:
-            print(f"⚠️  VERSION CONFLICTS ({len(results['conflicts'])}):")
+            lines.append(f"⚠️  VERSION CONFLICTS ({len(results['conflicts'])}):")
             for conflict in results['conflicts']:
-                print(f"  • {conflict['name']}")
-                print(f"    Installed: {conflict['installed']}")
-                print(f"    Required:  {conflict['required']}")
-            print()
+                lines.append(f"  • {conflict['name']}")
+                lines.append(f"    Installed: {conflict['installed']}")
+                lines.append(f"    Required:  {conflict['required']}")
+            lines.append("")
         
         # Extraneous Packages (Node.js only)
         if 'extraneous' in results and results['extraneous']:
-            print(f"⚠️  EXTRANEOUS PACKAGES ({len(results['extraneous'])}):")
-            print("  (Installed but not in package.json)")
-            for package in results['extraneous'][:10]:
-                print(f"  • {package}")
-            if len(results['extraneous']) > 10:
-                print(f"  ... and {len(results['extraneous']) - 10} more")
-            print()
+            lines.append(f"⚠️  EXTRANEOUS PACKAGES ({len(results['extraneous'])}):")
+            lines.append("  (Installed but not in package.json)")
+            for package in islice(results['extraneous'], REPORT_LIST_LIMIT):
+                lines.append(f"  • {package}")
+            if len(results['extraneous']) > REPORT_LIST_LIMIT:
+                lines.append(f"  ... and {len(results['extraneous']) - REPORT_LIST_LIMIT} more")
+            lines.append("")
         
         # Installed Dependencies
         if results['installed']:
-            print(f"✅ INSTALLED DEPENDENCIES ({len(results['installed'])}):")
-            for dep in results['installed'][:10]:
-                print(f"  • {dep['name']} ({dep['version']})")
-            if len(results['installed']) > 10:
-                print(f"  ... and {len(results['installed']) - 10} more")
-            print()
+            lines.append(f"✅ INSTALLED DEPENDENCIES ({len(results['installed'])}):")
+            for dep in islice(results['installed'], REPORT_LIST_LIMIT):
+                lines.append(f"  • {dep['name']} ({dep['version']})")
+            if len(results['installed']) > REPORT_LIST_LIMIT:
+                lines.append(f"  ... and {len(results['installed']) - REPORT_LIST_LIMIT} more")
+            lines.append("")
         
         # Outdated Packages
         if results['outdated']:
-            print(f"📦 OUTDATED PACKAGES ({len(results['outdated'])}):")
-            for pkg in results['outdated'][:10]:
+            lines.append(f"📦 OUTDATED PACKAGES ({len(results['outdated'])}):")
+            for pkg in islice(results['outdated'], REPORT_LIST_LIMIT):
                 if results['type'] == 'python':
-                    print(f"  • {pkg['name']}: {pkg['version']} → {pkg['latest_version']}")
+                    lines.append(f"  • {pkg['name']}: {pkg['version']} → {pkg['latest_version']}")
                 else:
-                    print(f"  • {pkg['name']}: {pkg['current']} → {pkg['latest']}")
-            if len(results['outdated']) > 10:
-                print(f"  ... and {len(results['outdated']) - 10} more")
-            print()
+                    lines.append(f"  • {pkg['name']}: {pkg['current']} → {pkg['latest']}")
+            if len(results['outdated']) > REPORT_LIST_LIMIT:
+                lines.append(f"  ... and {len(results['outdated']) - REPORT_LIST_LIMIT} more")
+            lines.append("")
         
         # Warnings
         if self.warnings:
-            print("⚠️  WARNINGS:")
+            lines.append("⚠️  WARNINGS:")
             for warning in self.warnings:
-                print(f"  • {warning}")
-            print()
+                lines.append(f"  • {warning}")
+            lines.append("")
         
         # Recommendations
-        print("💡 RECOMMENDATIONS:")
+        lines.append("💡 RECOMMENDATIONS:")
         
         if results['missing']:
             if results['type'] == 'python':
-                print("  📦 Install missing Python packages:")
-                print("     pip install -r requirements.txt")
+                lines.append("  📦 Install missing Python packages:")
+                lines.append("     pip install -r requirements.txt")
             else:
-                print("  📦 Install missing Node.js packages:")
-                print("     npm install")
+                lines.append("  📦 Install missing Node.js packages:")
+                lines.append("     npm install")
         
         if results['conflicts']:
-            print("  ⚠️  Resolve version conflicts:")
-            print("     1. Review conflicting package versions")
-            print("     2. Update dependency specifications")
-            print("     3. Test after version changes")
+            lines.append("  ⚠️  Resolve version conflicts:")
+            lines.append("     1. Review conflicting package versions")
+            lines.append("     2. Update dependency specifications")
+            lines.append("     3. Test after version changes")
         
         if results.get('outdated'):
             if results['type'] == 'python':
-                print("  📦 Update outdated packages:")
-                print("     pip install --upgrade <package-name>")
+                lines.append("  📦 Update outdated packages:")
+                lines.append("     pip install --upgrade <package-name>")
             else:
-                print("  📦 Update outdated packages:")
-                print("     npm update")
+                lines.append("  📦 Update outdated packages:")
+                lines.append("     npm update")
         
         if not any([results['missing'], results['conflicts'], results.get('outdated')]):
-            print("  ✅ All dependencies are properly installed and up to date!")
+            lines.append("  ✅ All dependencies are properly installed and up to date!")
+        
+        lines.append("\n" + "="*80 + "\n")
         
-        print("\n" + "="*80 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     parser = argparse.ArgumentParser(
@@ -410,12 +670,15 @@ Examples:
                        help='Project type (auto-detect by default)')
     parser.add_argument('--check-updates', action='store_true',
                        help='Check for available package updates')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore and do not write cached Python check results')
     
     args = parser.parse_args()
     
     checker = DependencyChecker(
         check_type=args.type,
-        check_updates=args.check_updates
+        check_updates=args.check_updates,
+        cache_dir=None if args.no_cache else CACHE_DIR
     )
     
     # Detect project type if auto
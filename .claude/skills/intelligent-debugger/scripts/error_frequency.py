@@ -10,57 +10,124 @@ Analyzes error patterns to identify:
 - Statistical anomaly detection
 
 Usage:
-    python error_frequency.py <log_file> [--window <minutes>] [--threshold <count>]
+    python error_frequency.py (<log_file> | --glob <pattern>) [--jobs <n>] [--window <minutes>] [--threshold <count>] [--rolling]
 """
 
+import os
 import sys
 import re
-from collections import defaultdict
+import heapq
+import glob
+from functools import lru_cache, partial
+from multiprocessing import Pool
+from collections import Counter, defaultdict
+from itertools import accumulate
 from datetime import datetime, timedelta
 import argparse
 from typing import Dict, List, Tuple
 
+from log_reader import iter_file_matching_lines, line_ranges
+
+# numpy is optional; spike statistics fall back to plain Python without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Words that mark a line as an error line (checked against the uppercased line)
+ERROR_INDICATORS = ('ERROR', 'EXCEPTION', 'FATAL', 'CRITICAL', 'FAIL')
+
+# Byte-level form of the indicators above, used to find candidate lines in the
+# mapped file (ASCII case-insensitive; the exact check runs on each hit)
+ERROR_CANDIDATE_RE = re.compile(rb'[EeCcFf](?i:rror|xception|atal|ritical|ail)')
+
+# First timestamp on the line: 2025-01-15 14:30:45, 2025-01-15T14:30:45Z, [2025-01-15 14:30:45]
+TIMESTAMP_RE = re.compile(
+    r'(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})(?:\s+|T)'
+    r'(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})'
+)
+
+# Error categories, most specific first; the first one found on a line wins.
+# Plain `in` checks on the uppercased line are kept on purpose: an
+# Aho-Corasick automaton (pyahocorasick) measured slower at every line length,
+# since it must visit every match to honour this priority order.
+ERROR_KEYWORDS = (
+    'NullPointerException', 'IndexOutOfBounds', 'TypeError',
+    'ValueError', 'KeyError', 'AttributeError', 'ConnectionError',
+    'TimeoutError', 'MemoryError', 'SyntaxError', 'ImportError',
+    '404', '500', '503', 'ERROR', 'EXCEPTION', 'FAILURE'
+)
+ERROR_KEYWORDS_UPPER = tuple((keyword.upper(), keyword) for keyword in ERROR_KEYWORDS)
+
+# Longest log span, in minutes, that rolling spike detection bins minute by minute
+ROLLING_MAX_SPAN_MINUTES = 90 * 24 * 60
+
+ONE_MINUTE = timedelta(minutes=1)
+
+MINUTES_PER_DAY = 24 * 60
+
+@lru_cache(maxsize=1024)
+def day_start_minute(date_text: str) -> int:
+    """Minute index (minutes since 0001-01-01) of a YYYY-MM-DD date, or None if invalid"""
+    try:
+        return datetime.strptime(date_text, '%Y-%m-%d').toordinal() * MINUTES_PER_DAY
+    except ValueError:
+        return None
+
+def minute_to_datetime(minute_index: int) -> datetime:
+    """Inverse of the minute index built by parse_minute"""
+    days, minutes = divmod(minute_index, MINUTES_PER_DAY)
+    return datetime.fromordinal(days) + timedelta(minutes=minutes)
+
 class ErrorFrequencyAnalyzer:
-    def __init__(self, log_file: str, window_minutes: int = 60, threshold: int = 5):
+    def __init__(self, log_file: str, window_minutes: int = 60, threshold: int = 5,
+                 rolling: bool = False):
         self.log_file = log_file
         self.window_minutes = window_minutes
         self.threshold = threshold
-        self.error_timeline = defaultdict(list)  # timestamp -> error messages
-        self.error_types = defaultdict(int)
+        self.rolling = rolling
+        self.minute_totals = Counter()  # minute -> error count (rolling mode only)
+        self.error_timeline = defaultdict(Counter)  # window start -> error type counts
+        self.window_totals = Counter()  # window start -> error count
+        self.error_types = Counter()
         
     def parse_timestamp(self, line: str) -> datetime:
         """Extract and parse timestamp from log line"""
-        timestamp_patterns = [
-            # 2025-01-15 14:30:45
-            r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})',
-            # 2025-01-15T14:30:45Z
-            r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})',
-            # [2025-01-15 14:30:45]
-            r'\[(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\]',
-        ]
-        
-        for pattern in timestamp_patterns:
-            match = re.search(pattern, line)
-            if match:
-                try:
-                    timestamp_str = match.group(1).replace('T', ' ').rstrip('Z')
-                    return datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                except:
-                    continue
-        return None
+        match = TIMESTAMP_RE.search(line)
+        if not match:
+            return None
+        # The regex captures each field, so build the datetime without strptime
+        year, month, day, hour, minute, second = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day),
+                            int(hour), int(minute), int(second))
+        except ValueError:
+            return None
+    
+    def parse_minute(self, line: str) -> int:
+        """Like parse_timestamp, but return the minute as an integer index
+        
+        Minutes since 0001-01-01; see minute_to_datetime. Invalid dates and
+        times are rejected exactly as datetime() would reject them.
+        """
+        match = TIMESTAMP_RE.search(line)
+        if not match:
+            return None
+        hour, minute, second = match.group('hour', 'minute', 'second')
+        hour, minute = int(hour), int(minute)
+        if hour > 23 or minute > 59 or int(second) > 59:
+            return None
+        day_start = day_start_minute(match.group()[:10])
+        if day_start is None:
+            return None
+        return day_start + hour * 60 + minute
     
-    def extract_error_type(self, line: str) -> str:
-        """Extract error type/category from line"""
-        error_keywords = [
-            'NullPointerException', 'IndexOutOfBounds', 'TypeError', 
-            'ValueError', 'KeyError', 'AttributeError', 'ConnectionError',
-            'TimeoutError', 'MemoryError', 'SyntaxError', 'ImportError',
-            '404', '500', '503', 'ERROR', 'EXCEPTION', 'FAILURE'
-        ]
-        
-        line_upper = line.upper()
-        for keyword in error_keywords:
-            if keyword.upper() in line_upper:
+    def extract_error_type(self, line: str, line_upper: str = None) -> str:
+        """Extract error type/category from line (pass line_upper if already computed)"""
+        if line_upper is None:
+            line_upper = line.upper()
+        for keyword_upper, keyword in ERROR_KEYWORDS_UPPER:
+            if keyword_upper in line_upper:
                 return keyword
         
         return "GENERIC_ERROR"
@@ -68,34 +135,7 @@ class ErrorFrequencyAnalyzer:
     def analyze(self) -> bool:
         """Analyze log file for error frequency patterns"""
         try:
-            with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    # Check if line contains error indicators
-                    if not any(indicator in line.upper() for indicator in 
-                              ['ERROR', 'EXCEPTION', 'FATAL', 'CRITICAL', 'FAIL']):
-                        continue
-                    
-                    timestamp = self.parse_timestamp(line)
-                    if not timestamp:
-                        continue
-                    
-                    error_type = self.extract_error_type(line)
-                    
-                    # Round to window boundaries for grouping
-                    window_key = timestamp.replace(
-                        minute=(timestamp.minute // self.window_minutes) * self.window_minutes,
-                        second=0,
-                        microsecond=0
-                    )
-                    
-                    self.error_timeline[window_key].append({
-                        'type': error_type,
-                        'timestamp': timestamp,
-                        'message': line.strip()[:200]
-                    })
-                    
-                    self.error_types[error_type] += 1
-            
+            self.scan_file(self.log_file)
             return len(self.error_timeline) > 0
             
         except FileNotFoundError:
@@ -105,144 +145,320 @@ class ErrorFrequencyAnalyzer:
             print(f"❌ Error analyzing file: {e}")
             return False
     
+    def analyze_files(self, log_files: List[str], jobs: int = 1) -> bool:
+        """Analyze log files in parallel and merge the results
+        
+        Each file is one task (e.g. a set of rotated logs); with jobs > 1 each
+        file is also split into that many line-aligned byte ranges.
+        """
+        try:
+            tasks = [(log_file, start, end) for log_file in log_files
+                     for start, end in line_ranges(log_file, jobs)]
+            scan = partial(scan_log_range, window_minutes=self.window_minutes,
+                           rolling=self.rolling)
+            if len(tasks) == 1:
+                partials = [scan(tasks[0])]
+            else:
+                with Pool(min(len(tasks), os.cpu_count() or 1)) as pool:
+                    partials = pool.map(scan, tasks)
+            
+            # Merge in file and range order so first-seen ordering matches a sequential scan
+            for other in partials:
+                self.merge(other)
+            return len(self.error_timeline) > 0
+            
+        except FileNotFoundError as e:
+            print(f"❌ Error: File '{e.filename}' not found")
+            return False
+        except Exception as e:
+            print(f"❌ Error analyzing file: {e}")
+            return False
+    
+    def merge(self, other: 'ErrorFrequencyAnalyzer'):
+        """Add another analyzer's tallies to this one"""
+        for window_key, type_counts in other.error_timeline.items():
+            self.error_timeline[window_key].update(type_counts)
+        self.window_totals.update(other.window_totals)
+        self.error_types.update(other.error_types)
+        self.minute_totals.update(other.minute_totals)
+    
+    def scan_file(self, log_file: str, start: int = 0, end: int = None):
+        """Tally the error lines of one log file, or of a byte range of it"""
+        # Windows and minutes are keyed by integer minute index while scanning
+        # and converted to datetimes once at the end
+        timeline = defaultdict(Counter)
+        minute_totals = Counter()
+        window_minutes = self.window_minutes
+        
+        with open(log_file, 'rb') as f:
+            for line in iter_file_matching_lines(f, ERROR_CANDIDATE_RE, start, end):
+                # Check if line contains error indicators; only prefiltered
+                # candidate lines get uppercased, and the copy is reused below
+                line_upper = line.upper()
+                if not any(indicator in line_upper for indicator in ERROR_INDICATORS):
+                    continue
+                
+                minute_index = self.parse_minute(line)
+                if minute_index is None:
+                    continue
+                
+                error_type = self.extract_error_type(line, line_upper)
+                
+                # Round down to window boundaries within the hour for grouping
+                window_key = minute_index - minute_index % 60 % window_minutes
+                
+                timeline[window_key][error_type] += 1
+                self.error_types[error_type] += 1
+                
+                if self.rolling:
+                    minute_totals[minute_index] += 1
+        
+        for window_key, type_counts in timeline.items():
+            window_time = minute_to_datetime(window_key)
+            self.error_timeline[window_time].update(type_counts)
+            self.window_totals[window_time] += sum(type_counts.values())
+        for minute_index, count in minute_totals.items():
+            self.minute_totals[minute_to_datetime(minute_index)] += count
+    
     def detect_spikes(self) -> List[Tuple[datetime, int, float]]:
         """Detect error spikes (periods with unusually high error rates)"""
-        if not self.error_timeline:
+        if not self.window_totals:
             return []
         
-        # Calculate average error rate
-        error_counts = [len(errors) for errors in self.error_timeline.values()]
-        avg_rate = sum(error_counts) / len(error_counts) if error_counts else 0
-        std_dev = (sum((x - avg_rate) ** 2 for x in error_counts) / len(error_counts)) ** 0.5
+        if np is not None:
+            spikes = self._detect_spikes_numpy()
+        else:
+            # Calculate average error rate
+            error_counts = list(self.window_totals.values())
+            avg_rate = sum(error_counts) / len(error_counts)
+            std_dev = (sum((x - avg_rate) ** 2 for x in error_counts) / len(error_counts)) ** 0.5
+            
+            # Spike threshold: mean + 2*std_dev
+            spike_threshold = avg_rate + (2 * std_dev)
+            
+            spikes = []
+            for window_time, error_count in sorted(self.window_totals.items()):
+                if error_count >= spike_threshold and error_count >= self.threshold:
+                    deviation = (error_count - avg_rate) / std_dev if std_dev > 0 else 0
+                    spikes.append((window_time, error_count, deviation))
+        
+        return sorted(spikes, key=lambda x: x[1], reverse=True)
+    
+    def _detect_spikes_numpy(self) -> List[Tuple[datetime, int, float]]:
+        """detect_spikes with the statistics and spike mask computed by numpy"""
+        windows = sorted(self.window_totals)
+        counts = np.fromiter(map(self.window_totals.__getitem__, windows),
+                             dtype=np.int64, count=len(windows))
+        avg_rate = counts.mean()
+        std_dev = counts.std()
         
         # Spike threshold: mean + 2*std_dev
-        spike_threshold = avg_rate + (2 * std_dev)
+        spike_idx = np.flatnonzero((counts >= avg_rate + 2 * std_dev) & (counts >= self.threshold))
+        spike_counts = counts[spike_idx]
+        if std_dev > 0:
+            deviations = ((spike_counts - avg_rate) / std_dev).tolist()
+        else:
+            deviations = [0] * len(spike_idx)
+        
+        return [(windows[i], count, deviation) for i, count, deviation
+                in zip(spike_idx.tolist(), spike_counts.tolist(), deviations, strict=True)]
+    
+    def detect_rolling_spikes(self) -> List[Tuple[datetime, int, float]]:
+        """Detect spikes over a window sliding one minute at a time
+        
+        Returns the peak window of each run of overlapping spike windows, or
+        None when the log spans more than ROLLING_MAX_SPAN_MINUTES.
+        """
+        if not self.minute_totals:
+            return []
+        
+        first_minute = min(self.minute_totals)
+        span = (max(self.minute_totals) - first_minute) // ONE_MINUTE + 1
+        if span > ROLLING_MAX_SPAN_MINUTES:
+            return None
         
+        per_minute = [0] * span
+        for minute, count in self.minute_totals.items():
+            per_minute[(minute - first_minute) // ONE_MINUTE] = count
+        
+        # Window sums as differences of prefix sums: O(span) for any window size
+        width = min(self.window_minutes, span)
+        if np is not None:
+            prefix = np.cumsum(np.array([0] + per_minute, dtype=np.int64))
+            sums = prefix[width:] - prefix[:-width]
+            avg_rate = sums.mean()
+            std_dev = sums.std()
+            candidates = np.flatnonzero(
+                (sums >= avg_rate + 2 * std_dev) & (sums >= self.threshold)).tolist()
+            sums = sums.tolist()
+        else:
+            prefix = list(accumulate(per_minute, initial=0))
+            sums = [prefix[i + width] - prefix[i] for i in range(span - width + 1)]
+            avg_rate = sum(sums) / len(sums)
+            std_dev = (sum((x - avg_rate) ** 2 for x in sums) / len(sums)) ** 0.5
+            spike_threshold = avg_rate + (2 * std_dev)
+            candidates = [i for i, total in enumerate(sums)
+                          if total >= spike_threshold and total >= self.threshold]
+        
+        # Neighbouring windows overlap, so report one peak per run of candidates
         spikes = []
-        for window_time, errors in sorted(self.error_timeline.items()):
-            error_count = len(errors)
-            if error_count >= spike_threshold and error_count >= self.threshold:
-                deviation = (error_count - avg_rate) / std_dev if std_dev > 0 else 0
-                spikes.append((window_time, error_count, deviation))
+        run_start = None
+        for pos, i in enumerate(candidates):
+            if run_start is None:
+                run_start = i
+            if pos + 1 < len(candidates) and candidates[pos + 1] == i + 1:
+                continue
+            peak = max(range(run_start, i + 1), key=sums.__getitem__)
+            deviation = (sums[peak] - avg_rate) / std_dev if std_dev > 0 else 0
+            spikes.append((first_minute + peak * ONE_MINUTE, sums[peak], float(deviation)))
+            run_start = None
         
         return sorted(spikes, key=lambda x: x[1], reverse=True)
     
-    def find_recurring_patterns(self) -> Dict[str, List[datetime]]:
-        """Identify errors that occur repeatedly"""
-        recurring = defaultdict(list)
+    def find_recurring_patterns(self) -> Dict[str, Tuple[int, datetime, datetime]]:
+        """Identify errors that occur repeatedly, as (count, first window, last window)"""
+        recurring = {}
         
-        for window_time, errors in self.error_timeline.items():
-            for error in errors:
-                error_type = error['type']
-                recurring[error_type].append(window_time)
+        for window_time, type_counts in self.error_timeline.items():
+            for error_type, count in type_counts.items():
+                if error_type in recurring:
+                    total, first_window, _ = recurring[error_type]
+                    recurring[error_type] = (total + count, first_window, window_time)
+                else:
+                    recurring[error_type] = (count, window_time, window_time)
         
         # Filter to only recurring patterns (>= threshold)
-        return {k: v for k, v in recurring.items() if len(v) >= self.threshold}
+        return {k: v for k, v in recurring.items() if v[0] >= self.threshold}
     
     def print_report(self):
         """Print comprehensive frequency analysis report"""
-        print("\n" + "="*80)
-        print(f"ERROR FREQUENCY ANALYSIS: {self.log_file}")
-        print(f"Analysis Window: {self.window_minutes} minutes | Threshold: {self.threshold}")
-        print("="*80 + "\n")
+        # One write for the whole report instead of a print() per line
+        sys.stdout.write('\n'.join(self.report_lines()) + '\n')
+    
+    def report_lines(self) -> List[str]:
+        """Build the frequency analysis report as a list of lines"""
+        out = []
+        out.append("\n" + "="*80)
+        out.append(f"ERROR FREQUENCY ANALYSIS: {self.log_file}")
+        out.append(f"Analysis Window: {self.window_minutes} minutes | Threshold: {self.threshold}")
+        out.append("="*80 + "\n")
         
         # Overall Statistics
-        total_windows = len(self.error_timeline)
-        total_errors = sum(len(errors) for errors in self.error_timeline.values())
+        total_windows = len(self.window_totals)
+        total_errors = sum(self.window_totals.values())
         
         if total_errors == 0:
-            print("✅ No errors found in the analyzed timeframe.\n")
-            return
+            out.append("✅ No errors found in the analyzed timeframe.\n")
+            return out
         
         avg_errors_per_window = total_errors / total_windows if total_windows > 0 else 0
         
-        print(f"📊 OVERALL STATISTICS:")
-        print(f"  Total Error Count: {total_errors}")
-        print(f"  Time Windows Analyzed: {total_windows}")
-        print(f"  Average Errors per {self.window_minutes}min: {avg_errors_per_window:.1f}")
+        out.append(f"📊 OVERALL STATISTICS:")
+        out.append(f"  Total Error Count: {total_errors}")
+        out.append(f"  Time Windows Analyzed: {total_windows}")
+        out.append(f"  Average Errors per {self.window_minutes}min: {avg_errors_per_window:.1f}")
         
         if self.error_timeline:
             first_error = min(self.error_timeline.keys())
             last_error = max(self.error_timeline.keys())
-            print(f"  First Error: {first_error.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"  Last Error: {last_error.strftime('%Y-%m-%d %H:%M:%S')}")
+            out.append(f"  First Error: {first_error.strftime('%Y-%m-%d %H:%M:%S')}")
+            out.append(f"  Last Error: {last_error.strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Error Types Distribution
-        print(f"\n🔍 ERROR TYPES DISTRIBUTION:")
-        for error_type, count in sorted(self.error_types.items(), 
-                                        key=lambda x: x[1], reverse=True)[:10]:
+        out.append(f"\n🔍 ERROR TYPES DISTRIBUTION:")
+        for error_type, count in heapq.nlargest(10, self.error_types.items(),
+                                                key=lambda x: x[1]):
             percentage = (count / total_errors * 100) if total_errors > 0 else 0
             bar = '█' * int(percentage / 2)
-            print(f"  {error_type:25s}: {count:5d} ({percentage:5.1f}%) {bar}")
+            out.append(f"  {error_type:25s}: {count:5d} ({percentage:5.1f}%) {bar}")
         
         # Spike Detection
         spikes = self.detect_spikes()
         if spikes:
-            print(f"\n🚨 ERROR SPIKES DETECTED ({len(spikes)} spikes):")
+            out.append(f"\n🚨 ERROR SPIKES DETECTED ({len(spikes)} spikes):")
             for i, (spike_time, count, deviation) in enumerate(spikes[:10], 1):
-                print(f"\n  {i}. {spike_time.strftime('%Y-%m-%d %H:%M')} - {count} errors")
-                print(f"     Severity: {deviation:.1f}σ above average")
+                out.append(f"\n  {i}. {spike_time.strftime('%Y-%m-%d %H:%M')} - {count} errors")
+                out.append(f"     Severity: {deviation:.1f}σ above average")
                 
                 # Show error types in this spike
-                errors_in_spike = self.error_timeline[spike_time]
-                error_type_counts = defaultdict(int)
-                for error in errors_in_spike:
-                    error_type_counts[error['type']] += 1
-                
-                print(f"     Error types: {dict(error_type_counts)}")
+                out.append(f"     Error types: {dict(self.error_timeline[spike_time])}")
         else:
-            print("\n✅ No significant error spikes detected")
+            out.append("\n✅ No significant error spikes detected")
+        
+        # Rolling-window Spike Detection
+        if self.rolling:
+            rolling_spikes = self.detect_rolling_spikes()
+            if rolling_spikes is None:
+                out.append(f"\n⚠️  Rolling spike check skipped: log spans more than "
+                      f"{ROLLING_MAX_SPAN_MINUTES // (24 * 60)} days")
+            elif rolling_spikes:
+                out.append(f"\n📈 ROLLING WINDOW SPIKES ({self.window_minutes}-minute window, "
+                      f"1-minute step, {len(rolling_spikes)} spikes):")
+                for i, (start, count, deviation) in enumerate(rolling_spikes[:10], 1):
+                    end = start + self.window_minutes * ONE_MINUTE
+                    out.append(f"\n  {i}. {start.strftime('%Y-%m-%d %H:%M')} to "
+                          f"{end.strftime('%H:%M')} - {count} errors")
+                    out.append(f"     Severity: {deviation:.1f}σ above average")
+            else:
+                out.append("\n✅ No rolling-window error spikes detected")
         
         # Recurring Patterns
         recurring = self.find_recurring_patterns()
         if recurring:
-            print(f"\n🔄 RECURRING ERROR PATTERNS:")
-            for error_type, occurrences in sorted(recurring.items(), 
-                                                  key=lambda x: len(x[1]), 
-                                                  reverse=True)[:5]:
-                print(f"\n  {error_type}: {len(occurrences)} occurrences")
-                print(f"     Time windows: {occurrences[0].strftime('%H:%M')} to " +
-                      f"{occurrences[-1].strftime('%H:%M')}")
-                
-                # Calculate frequency pattern
-                time_diffs = []
-                for i in range(1, len(occurrences)):
-                    diff = (occurrences[i] - occurrences[i-1]).total_seconds() / 60
-                    time_diffs.append(diff)
+            out.append(f"\n🔄 RECURRING ERROR PATTERNS:")
+            for error_type, (occurrences, first_window, last_window) in heapq.nlargest(
+                    5, recurring.items(), key=lambda x: x[1][0]):
+                out.append(f"\n  {error_type}: {occurrences} occurrences")
+                out.append(f"     Time windows: {first_window.strftime('%H:%M')} to " +
+                      f"{last_window.strftime('%H:%M')}")
                 
-                if time_diffs:
-                    avg_interval = sum(time_diffs) / len(time_diffs)
-                    print(f"     Average interval: {avg_interval:.1f} minutes")
+                # Calculate frequency pattern; the gaps between successive
+                # occurrences add up to the first-to-last span
+                if occurrences > 1:
+                    span = (last_window - first_window).total_seconds() / 60
+                    avg_interval = span / (occurrences - 1)
+                    out.append(f"     Average interval: {avg_interval:.1f} minutes")
         
         # Recommendations
-        print("\n💡 RECOMMENDATIONS:")
+        out.append("\n💡 RECOMMENDATIONS:")
         
         if spikes:
-            print("  🚨 CRITICAL: Error spikes detected!")
-            print("     1. Investigate the time periods with highest error rates")
-            print("     2. Check for deployment or config changes at spike times")
-            print("     3. Review system resource usage during spike periods")
+            out.append("  🚨 CRITICAL: Error spikes detected!")
+            out.append("     1. Investigate the time periods with highest error rates")
+            out.append("     2. Check for deployment or config changes at spike times")
+            out.append("     3. Review system resource usage during spike periods")
         
         if recurring:
-            print("  ⚠️  Recurring error patterns found:")
-            print("     1. These errors may indicate systemic issues")
-            print("     2. Review error types that occur repeatedly")
-            print("     3. Consider implementing permanent fixes")
+            out.append("  ⚠️  Recurring error patterns found:")
+            out.append("     1. These errors may indicate systemic issues")
+            out.append("     2. Review error types that occur repeatedly")
+            out.append("     3. Consider implementing permanent fixes")
         
         error_rate = total_errors / total_windows if total_windows > 0 else 0
         if error_rate > 10:
-            print("  ⚠️  High error rate detected:")
-            print("     1. Error rate exceeds normal thresholds")
-            print("     2. System health may be compromised")
-            print("     3. Immediate investigation recommended")
-        
-        print("\n  📋 Next Steps:")
-        print("     1. Focus on the most frequent error types")
-        print("     2. Investigate error spikes for root causes")
-        print("     3. Check correlation with system events (deployments, traffic spikes)")
-        print("     4. Review error messages for specific failure points")
-        
-        print("\n" + "="*80 + "\n")
+            out.append("  ⚠️  High error rate detected:")
+            out.append("     1. Error rate exceeds normal thresholds")
+            out.append("     2. System health may be compromised")
+            out.append("     3. Immediate investigation recommended")
+        
+        out.append("\n  📋 Next Steps:")
+        out.append("     1. Focus on the most frequent error types")
+        out.append("     2. Investigate error spikes for root causes")
+        out.append("     3. Check correlation with system events (deployments, traffic spikes)")
+        out.append("     4. Review error messages for specific failure points")
+        
+        out.append("\n" + "="*80 + "\n")
+        
+        return out
+
+
+def scan_log_range(task: Tuple[str, int, int], window_minutes: int,
+                   rolling: bool) -> ErrorFrequencyAnalyzer:
+    """Worker for analyze_files: scan one (log_file, start, end) range and return its tallies"""
+    log_file, start, end = task
+    analyzer = ErrorFrequencyAnalyzer(log_file, window_minutes=window_minutes, rolling=rolling)
+    analyzer.scan_file(log_file, start, end)
+    return analyzer
 
 def main():
     parser = argparse.ArgumentParser(
@@ -258,24 +474,53 @@ Examples:
   
   # Only flag spikes with 10+ errors
   python error_frequency.py app.log --threshold 10
+  
+  # Also look for spikes in a 15-minute window sliding minute by minute
+  python error_frequency.py app.log --window 15 --rolling
+  
+  # Analyze rotated logs together, one worker process per file
+  python error_frequency.py --glob 'logs/app.log*'
+  
+  # Split one large log across 8 worker processes
+  python error_frequency.py huge.log --jobs 8
         '''
     )
     
-    parser.add_argument('log_file', help='Path to log file')
+    parser.add_argument('log_file', nargs='?', help='Path to log file')
+    parser.add_argument('--glob', metavar='PATTERN',
+                       help='Analyze all files matching PATTERN in parallel instead of one log file')
     parser.add_argument('--window', type=int, default=60,
                        help='Time window in minutes for grouping errors (default: 60)')
     parser.add_argument('--threshold', type=int, default=5,
                        help='Minimum error count to flag as spike (default: 5)')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Split each log file into N byte ranges scanned in parallel (default: 1)')
+    parser.add_argument('--rolling', action='store_true',
+                       help='Also detect spikes with a window sliding one minute at a time')
     
     args = parser.parse_args()
+    if (args.log_file is None) == (args.glob is None):
+        parser.error('give either a log file or --glob')
     
     analyzer = ErrorFrequencyAnalyzer(
-        args.log_file,
+        args.log_file or args.glob,
         window_minutes=args.window,
-        threshold=args.threshold
+        threshold=args.threshold,
+        rolling=args.rolling
     )
     
-    if analyzer.analyze():
+    if args.glob:
+        log_files = sorted(glob.glob(args.glob))
+        if not log_files:
+            print(f"❌ Error: No files match '{args.glob}'")
+            sys.exit(1)
+        ok = analyzer.analyze_files(log_files, args.jobs)
+    elif args.jobs > 1:
+        ok = analyzer.analyze_files([args.log_file], args.jobs)
+    else:
+        ok = analyzer.analyze()
+    
+    if ok:
         analyzer.print_report()
         sys.exit(0)
     else:
@@ -10,97 +10,102 @@ Analyzes log files to identify:
 - Error clustering
 
 Usage:
-    python log_analyzer.py <log_file> [--errors-only] [--last-hours <hours>]
+    python log_analyzer.py (<log_file> | --glob <pattern>) [--jobs <n>] [--errors-only] [--last-hours <hours>]
 """
 
+import os
 import sys
 import re
-from collections import Counter, defaultdict
+import heapq
+import glob
+from functools import partial
+from multiprocessing import Pool
+from collections import Counter
 from datetime import datetime, timedelta
 import argparse
 
+from log_reader import READ_BUFFER_SIZE, iter_file_matching_lines, iter_file_range_lines, line_ranges
+
+# Hour keys collected before they are tallied into the timeline in one update
+TIMELINE_BATCH_SIZE = 100000
+
+# Byte-level prefilter for lines that can carry an ERROR/CRITICAL/FATAL level
+# (ASCII case-insensitive; parse_line still decides the actual level)
+ERROR_LEVEL_CANDIDATE_RE = re.compile(rb'[EeCcFf](?i:rror|ritical|atal)')
+
+# Timestamped format, "<timestamp> ... [LEVEL] Message", e.g.
+#   2025-01-15 14:30:45 [ERROR] Message
+#   2025-01-15T14:30:45Z [ERROR] Message
+TIMESTAMPED_LINE_RE = re.compile(
+    r'(\d{4}-\d{2}-\d{2}(?:\s+\d{2}:\d{2}:\d{2}|T\d{2}:\d{2}:\d{2}Z?)).*?\[(\w+)\]\s+(.*)'
+)
+
+# Simple format: ERROR: Message
+SIMPLE_LINE_RE = re.compile(r'(\w+):\s+(.*)')
+
+# Numbers, hex literals and long hex ids masked out of error messages so
+# that messages differing only in ids/ports/counts share one counter key
+MESSAGE_VARIABLE_RE = re.compile(r'\b(?:0x[0-9a-f]+|[0-9a-f]{8,}|\d+)\b', re.IGNORECASE)
+
 class LogAnalyzer:
     def __init__(self, log_file, errors_only=False, last_hours=None):
         self.log_file = log_file
         self.errors_only = errors_only
         self.last_hours = last_hours
+        # Fixed once per run rather than re-read from the clock for every line
+        self.cutoff = datetime.now() - timedelta(hours=last_hours) if last_hours else None
         self.error_patterns = []
         self.log_levels = Counter()
         self.error_messages = Counter()
-        self.timeline = defaultdict(int)
+        self.timeline = Counter()
         
     def parse_line(self, line):
         """Parse a log line and extract key information"""
-        # Common log patterns
-        patterns = [
-            # Standard format: 2025-01-15 14:30:45 [ERROR] Message
-            r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}).*?\[(\w+)\]\s+(.*)',
-            # ISO format: 2025-01-15T14:30:45Z [ERROR] Message
-            r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[Z]?).*?\[(\w+)\]\s+(.*)',
-            # Simple format: ERROR: Message
-            r'(\w+):\s+(.*)',
-        ]
+        match = TIMESTAMPED_LINE_RE.search(line)
+        if match:
+            timestamp, level, message = match.groups()
+            return {'timestamp': timestamp, 'level': level, 'message': message}
         
-        for pattern in patterns:
-            match = re.search(pattern, line)
-            if match:
-                if len(match.groups()) == 3:
-                    timestamp, level, message = match.groups()
-                    return {'timestamp': timestamp, 'level': level, 'message': message}
-                elif len(match.groups()) == 2:
-                    level, message = match.groups()
-                    return {'timestamp': None, 'level': level, 'message': message}
+        match = SIMPLE_LINE_RE.search(line)
+        if match:
+            level, message = match.groups()
+            return {'timestamp': None, 'level': level, 'message': message}
         
         return None
     
     def is_within_timeframe(self, timestamp):
         """Check if timestamp is within the requested timeframe"""
-        if not self.last_hours or not timestamp:
+        if self.cutoff is None or not timestamp:
             return True
         
+        # Unparseable times are kept, and so are Z-suffixed ones: they parse as
+        # aware datetimes, which can't be compared with the naive cutoff
         try:
-            log_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            cutoff = datetime.now() - timedelta(hours=self.last_hours)
-            return log_time >= cutoff
-        except:
+            return datetime.fromisoformat(timestamp) >= self.cutoff
+        except (ValueError, TypeError):
             return True
     
+    def iter_lines(self, log_file, start=0, end=None):
+        """Yield the lines of log_file (or of a byte range of it) worth parsing"""
+        if not self.errors_only:
+            if end is not None:
+                with open(log_file, 'rb') as f:
+                    yield from iter_file_range_lines(f, start, end)
+                return
+            with open(log_file, 'r', encoding='utf-8', errors='ignore',
+                      buffering=READ_BUFFER_SIZE) as f:
+                yield from f
+            return
+        
+        # Error lines are usually a small share of the log, so scan the raw
+        # bytes and only decode the lines that mention an error level
+        with open(log_file, 'rb') as f:
+            yield from iter_file_matching_lines(f, ERROR_LEVEL_CANDIDATE_RE, start, end)
+    
     def analyze(self):
         """Analyze the log file"""
         try:
-            with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    parsed = self.parse_line(line)
-                    if not parsed:
-                        continue
-                    
-                    level = parsed['level'].upper()
-                    
-                    # Filter by errors if requested
-                    if self.errors_only and level not in ['ERROR', 'CRITICAL', 'FATAL']:
-                        continue
-                    
-                    # Filter by time if requested
-                    if not self.is_within_timeframe(parsed['timestamp']):
-                        continue
-                    
-                    # Count log levels
-                    self.log_levels[level] += 1
-                    
-                    # Track error messages
-                    if level in ['ERROR', 'CRITICAL', 'FATAL', 'EXCEPTION']:
-                        # Clean and normalize message
-                        message = parsed['message'][:200]  # First 200 chars
-                        self.error_messages[message] += 1
-                    
-                    # Build timeline (by hour)
-                    if parsed['timestamp']:
-                        try:
-                            hour = parsed['timestamp'][:13]  # YYYY-MM-DD HH
-                            self.timeline[hour] += 1
-                        except:
-                            pass
-            
+            self.scan_file(self.log_file)
             return True
         except FileNotFoundError:
             print(f"❌ Error: File '{self.log_file}' not found")
@@ -109,6 +114,77 @@ class LogAnalyzer:
             print(f"❌ Error analyzing log: {e}")
             return False
     
+    def analyze_files(self, log_files, jobs=1):
+        """Analyze log files in parallel and merge the results
+        
+        Each file is one task (e.g. a set of rotated logs); with jobs > 1 each
+        file is also split into that many line-aligned byte ranges.
+        """
+        try:
+            tasks = [(log_file, start, end) for log_file in log_files
+                     for start, end in line_ranges(log_file, jobs)]
+            scan = partial(scan_log_range, errors_only=self.errors_only,
+                           last_hours=self.last_hours)
+            if len(tasks) == 1:
+                partials = [scan(tasks[0])]
+            else:
+                with Pool(min(len(tasks), os.cpu_count() or 1)) as pool:
+                    partials = pool.map(scan, tasks)
+            
+            # Merge in file and range order so first-seen ordering matches a sequential scan
+            for other in partials:
+                self.merge(other)
+            return True
+        except FileNotFoundError as e:
+            print(f"❌ Error: File '{e.filename}' not found")
+            return False
+        except Exception as e:
+            print(f"❌ Error analyzing log: {e}")
+            return False
+    
+    def merge(self, other):
+        """Add another analyzer's tallies to this one"""
+        self.log_levels.update(other.log_levels)
+        self.error_messages.update(other.error_messages)
+        self.timeline.update(other.timeline)
+    
+    def scan_file(self, log_file, start=0, end=None):
+        """Tally the lines of one log file, or of a byte range of it"""
+        hours = []
+        for line in self.iter_lines(log_file, start, end):
+            parsed = self.parse_line(line)
+            if not parsed:
+                continue
+            
+            level = parsed['level'].upper()
+            
+            # Filter by errors if requested
+            if self.errors_only and level not in ['ERROR', 'CRITICAL', 'FATAL']:
+                continue
+            
+            # Filter by time if requested
+            if not self.is_within_timeframe(parsed['timestamp']):
+                continue
+            
+            # Count log levels
+            self.log_levels[level] += 1
+            
+            # Track error messages
+            if level in ['ERROR', 'CRITICAL', 'FATAL', 'EXCEPTION']:
+                # Clean and normalize message into a template
+                message = MESSAGE_VARIABLE_RE.sub('#', ' '.join(parsed['message'].split()))
+                message = message[:200]  # First 200 chars
+                self.error_messages[message] += 1
+            
+            # Build timeline (by hour)
+            if parsed['timestamp']:
+                hours.append(parsed['timestamp'][:13])  # YYYY-MM-DD HH
+                if len(hours) >= TIMELINE_BATCH_SIZE:
+                    self.timeline.update(hours)
+                    hours.clear()
+        
+        self.timeline.update(hours)
+    
     def print_report(self):
         """Print analysis report"""
         print("\n" + "="*80)
@@ -134,8 +210,8 @@ class LogAnalyzer:
         # Timeline
         if self.timeline:
             print("\n📅 ERROR TIMELINE (by hour):")
-            sorted_timeline = sorted(self.timeline.items())
-            for timestamp, count in sorted_timeline[-20:]:  # Last 20 hours
+            # Last 20 hours, oldest first
+            for timestamp, count in sorted(heapq.nlargest(20, self.timeline.items())):
                 bar = '█' * min(count // 10, 50)
                 print(f"  {timestamp}: {bar} ({count})")
         
@@ -163,6 +239,13 @@ class LogAnalyzer:
         
         print("\n" + "="*80 + "\n")
 
+def scan_log_range(task, errors_only, last_hours):
+    """Worker for analyze_files: scan one (log_file, start, end) range and return its tallies"""
+    log_file, start, end = task
+    analyzer = LogAnalyzer(log_file, errors_only=errors_only, last_hours=last_hours)
+    analyzer.scan_file(log_file, start, end)
+    return analyzer
+
 def main():
     parser = argparse.ArgumentParser(
         description='Analyze log files for debugging',
@@ -172,24 +255,43 @@ Examples:
   python log_analyzer.py app.log
   python log_analyzer.py app.log --errors-only
   python log_analyzer.py app.log --last-hours 24
+  python log_analyzer.py --glob 'logs/app.log*' --errors-only
+  python log_analyzer.py huge.log --jobs 8
         '''
     )
     
-    parser.add_argument('log_file', help='Path to log file')
+    parser.add_argument('log_file', nargs='?', help='Path to log file')
+    parser.add_argument('--glob', metavar='PATTERN',
+                       help='Analyze all files matching PATTERN in parallel instead of one log file')
+    parser.add_argument('--jobs', type=int, default=1,
+                       help='Split each log file into N byte ranges scanned in parallel (default: 1)')
     parser.add_argument('--errors-only', action='store_true',
                        help='Show only errors (ERROR, CRITICAL, FATAL)')
     parser.add_argument('--last-hours', type=int,
                        help='Only analyze logs from last N hours')
     
     args = parser.parse_args()
+    if (args.log_file is None) == (args.glob is None):
+        parser.error('give either a log file or --glob')
     
     analyzer = LogAnalyzer(
-        args.log_file,
+        args.log_file or args.glob,
         errors_only=args.errors_only,
         last_hours=args.last_hours
     )
     
-    if analyzer.analyze():
+    if args.glob:
+        log_files = sorted(glob.glob(args.glob))
+        if not log_files:
+            print(f"❌ Error: No files match '{args.glob}'")
+            sys.exit(1)
+        ok = analyzer.analyze_files(log_files, args.jobs)
+    elif args.jobs > 1:
+        ok = analyzer.analyze_files([args.log_file], args.jobs)
+    else:
+        ok = analyzer.analyze()
+    
+    if ok:
         analyzer.print_report()
         sys.exit(0)
     else:
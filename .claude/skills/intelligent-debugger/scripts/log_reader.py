@@ -0,0 +1,104 @@
+"""
+Log Reader - Line scanning helpers shared by log_analyzer.py and error_frequency.py
+
+Reads logs as bytes (memory-mapped when possible) and only decodes the lines
+that are needed, matching what text mode would have produced.
+"""
+
+import io
+import os
+import mmap
+from typing import List, Tuple
+
+# Read buffer for log files, and the block size for logs that can't be memory-mapped
+READ_BUFFER_SIZE = 16 * 1024 * 1024
+
+def iter_matching_lines(data, pattern, start: int = 0, end: int = None):
+    """Yield the lines of data[start:end] (bytes or mmap) that contain a pattern match, as text mode would
+    
+    start and end must fall on line boundaries.
+    """
+    search = pattern.search
+    if end is None:
+        end = len(data)
+    pos = start
+    while True:
+        match = search(data, pos, end)
+        if not match:
+            return
+        line_start = data.rfind(b'\n', start, match.start()) + 1 or start
+        line_end = data.find(b'\n', match.end(), end)
+        line_end = end if line_end < 0 else line_end + 1
+        # Only matched lines are decoded
+        line = data[line_start:line_end].decode('utf-8', 'ignore')
+        if '\r' in line:
+            # Let universal newlines translate \r\n and split on lone \r
+            yield from io.StringIO(line, newline=None)
+        else:
+            yield line
+        pos = line_end
+
+def iter_file_matching_lines(f, pattern, start: int = 0, end: int = None):
+    """Yield the lines of binary file f that contain a pattern match
+    
+    A start/end byte range (see line_ranges) is only honoured for files that
+    can be memory-mapped.
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        # Empty files, pipes and process substitution can't be mapped; read
+        # them in large blocks cut at the last newline instead
+        tail = b''
+        while True:
+            chunk = f.read(READ_BUFFER_SIZE)
+            if not chunk:
+                break
+            block = tail + chunk
+            cut = block.rfind(b'\n') + 1
+            tail = block[cut:]
+            yield from iter_matching_lines(block[:cut], pattern)
+        yield from iter_matching_lines(tail, pattern)
+        return
+    with mm:
+        yield from iter_matching_lines(mm, pattern, start, end)
+
+def iter_file_range_lines(f, start: int, end: int):
+    """Yield every line of binary file f between byte offsets start and end, as text mode would"""
+    f.seek(start)
+    remaining = end - start
+    tail = b''
+    while remaining > 0:
+        chunk = f.read(min(READ_BUFFER_SIZE, remaining))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+        block = tail + chunk
+        cut = block.rfind(b'\n') + 1
+        tail = block[cut:]
+        yield from io.StringIO(block[:cut].decode('utf-8', 'ignore'), newline=None)
+    yield from io.StringIO(tail.decode('utf-8', 'ignore'), newline=None)
+
+def line_ranges(log_file: str, parts: int) -> List[Tuple[int, int]]:
+    """Split log_file into up to `parts` byte ranges that start on line boundaries
+    
+    Inputs that can't be memory-mapped (pipes, empty files) come back whole,
+    as a single (0, None) range.
+    """
+    if parts <= 1 or not os.path.isfile(log_file):
+        return [(0, None)]
+    size = os.path.getsize(log_file)
+    if size == 0:
+        return [(0, None)]
+    
+    bounds = [0]
+    with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, parts):
+            # The next line start at or after the even split point
+            newline = mm.find(b'\n', max(i * size // parts, bounds[-1], 1) - 1)
+            if newline < 0 or newline + 1 >= size:
+                break
+            if newline + 1 > bounds[-1]:
+                bounds.append(newline + 1)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:], strict=False))
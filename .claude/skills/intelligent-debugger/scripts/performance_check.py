@@ -9,15 +9,21 @@ Checks:
 - Resource bottlenecks
 
 Usage:
-    python performance_check.py [--url <url>] [--iterations <n>]
+    python performance_check.py [--url <url>] [--iterations <n>] [--concurrent <n>]
 """
 
 import sys
 import time
+import heapq
 import psutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from statistics import mean, median, stdev
 
+# Seconds between the two cpu_percent() readings of a process; the first
+# reading of a fresh Process always returns 0.0
+CPU_SAMPLE_INTERVAL = 0.5
+
 def check_system_resources():
     """Check current system resource usage"""
     print("\n📊 SYSTEM RESOURCES:")
@@ -59,10 +65,18 @@ def check_system_resources():
     else:
         print("  ✅ Disk space is adequate")
 
-def check_response_time(url, iterations=10):
+def _timed_get(session, url):
+    """Issue one GET and return (elapsed ms, status code)"""
+    start = time.perf_counter_ns()
+    response = session.get(url, timeout=10)
+    elapsed = (time.perf_counter_ns() - start) / 1e6  # Convert to ms
+    return elapsed, response.status_code
+
+def check_response_time(url, iterations=10, concurrent=0):
     """Check HTTP endpoint response times"""
     try:
         import requests
+        from requests.adapters import HTTPAdapter
     except ImportError:
         print("❌ requests library not installed. Run: pip install requests")
         return
@@ -71,22 +85,36 @@ def check_response_time(url, iterations=10):
     print("="*60)
     print(f"Testing with {iterations} requests...\n")
     
+    # One keep-alive session so only the first request pays for DNS/TCP/TLS
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(concurrent, 1))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    
     times = []
     success_count = 0
     
-    for i in range(iterations):
-        try:
-            start = time.time()
-            response = requests.get(url, timeout=10)
-            elapsed = (time.time() - start) * 1000  # Convert to ms
-            
-            times.append(elapsed)
-            if response.status_code == 200:
-                success_count += 1
-            
-            print(f"  Request {i+1}: {elapsed:.2f}ms (Status: {response.status_code})")
-        except requests.exceptions.RequestException as e:
-            print(f"  Request {i+1}: FAILED - {e}")
+    with session:
+        if concurrent > 1:
+            with ThreadPoolExecutor(max_workers=concurrent) as executor:
+                futures = [executor.submit(_timed_get, session, url) for _ in range(iterations)]
+        else:
+            futures = None
+        
+        for i in range(iterations):
+            try:
+                if futures:
+                    elapsed, status = futures[i].result()
+                else:
+                    elapsed, status = _timed_get(session, url)
+                
+                times.append(elapsed)
+                if status == 200:
+                    success_count += 1
+                
+                print(f"  Request {i+1}: {elapsed:.2f}ms (Status: {status})")
+            except requests.exceptions.RequestException as e:
+                print(f"  Request {i+1}: FAILED - {e}")
     
     if times:
         print(f"\n📊 STATISTICS:")
@@ -114,40 +142,64 @@ def check_response_time(url, iterations=10):
             if variation > 30:
                 print("  ⚠️  High variability - investigate inconsistent performance")
 
+def sample_cpu_percent(procs):
+    """Sample CPU usage of processes over CPU_SAMPLE_INTERVAL"""
+    for proc in procs:
+        try:
+            proc.cpu_percent(None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    
+    time.sleep(CPU_SAMPLE_INTERVAL)
+    
+    samples = []
+    for proc in procs:
+        try:
+            samples.append((proc, proc.cpu_percent(None)))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return samples
+
 def check_process(process_name=None):
     """Check specific process resource usage"""
     print("\n🔍 PROCESS CHECK:")
     print("="*60)
     
     if process_name:
+        # Filter by name before sampling so only matching processes are read
+        needle = process_name.lower()
+        procs = [proc for proc in psutil.process_iter(['pid', 'name'])
+                 if needle in (proc.info['name'] or '').lower()]
+        
         found = False
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-            if process_name.lower() in proc.info['name'].lower():
-                found = True
-                print(f"Process: {proc.info['name']} (PID: {proc.info['pid']})")
-                print(f"  CPU: {proc.info['cpu_percent']}%")
-                print(f"  Memory: {proc.info['memory_percent']:.2f}%")
+        for proc, cpu in sample_cpu_percent(procs):
+            try:
+                memory_percent = proc.memory_percent()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            found = True
+            print(f"Process: {proc.info['name']} (PID: {proc.info['pid']})")
+            print(f"  CPU: {cpu}%")
+            print(f"  Memory: {memory_percent:.2f}%")
         
         if not found:
             print(f"❌ Process '{process_name}' not found")
     else:
         # Show top 5 processes by CPU
         print("Top 5 processes by CPU:")
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent']):
-            try:
-                processes.append((proc.info['name'], proc.info['cpu_percent']))
-            except:
-                pass
+        procs = list(psutil.process_iter(['pid', 'name']))
+        samples = sample_cpu_percent(procs)
         
-        for name, cpu in sorted(processes, key=lambda x: x[1], reverse=True)[:5]:
-            print(f"  {name}: {cpu}%")
+        for proc, cpu in heapq.nlargest(5, samples, key=lambda x: x[1]):
+            print(f"  {proc.info['name']}: {cpu}%")
 
 def main():
     parser = argparse.ArgumentParser(description='Performance check for debugging')
     parser.add_argument('--url', help='URL to check response time')
     parser.add_argument('--iterations', type=int, default=10,
                        help='Number of requests to make (default: 10)')
+    parser.add_argument('--concurrent', type=int, default=0,
+                       help='Send requests from this many threads (default: sequential)')
     parser.add_argument('--process', help='Process name to monitor')
     
     args = parser.parse_args()
@@ -161,7 +213,7 @@ def main():
     
     # Check URL if provided
     if args.url:
-        check_response_time(args.url, args.iterations)
+        check_response_time(args.url, args.iterations, args.concurrent)
     
     # Check process if provided
     if args.process:
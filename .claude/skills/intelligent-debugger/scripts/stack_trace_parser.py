@@ -12,10 +12,19 @@ Usage:
     python stack_trace_parser.py <file_with_stack_trace>
     OR
     echo "stack trace" | python stack_trace_parser.py
+    OR
+    python stack_trace_parser.py --batch [<file>]  (traces separated by "---" lines)
+
+The module is pure Python, so long batch runs can use PyPy:
+    pypy3 stack_trace_parser.py --batch < traces.txt
 """
 
 import sys
 import re
+import mmap
+import locale
+from functools import lru_cache
+from typing import NamedTuple
 
 ERROR_EXPLANATIONS = {
     'KeyError': 'Dictionary key not found. Check if key exists before accessing or use dict.get()',
@@ -35,13 +44,78 @@ ERROR_EXPLANATIONS = {
     'RuntimeError': 'Generic runtime error. Review error message for specifics'
 }
 
+# Debugging suggestions per exact error type
+DEBUGGING_SUGGESTIONS = {
+    'KeyError': (
+        "Check if the key exists before accessing: if 'key' in dict:",
+        "Use dict.get('key', default_value) for safe access",
+        "Print dictionary keys to verify available keys",
+        "Check for typos in the key name"
+    ),
+    'IndexError': (
+        "Check array length before accessing: if len(array) > index:",
+        "Use enumerate() to iterate safely",
+        "Verify the array is populated with expected data",
+        "Check for off-by-one errors in index calculations"
+    ),
+    'TypeError': (
+        "Print variable types to verify: print(type(variable))",
+        "Check if variables are initialized properly",
+        "Verify function arguments are correct types",
+        "Look for None values being used incorrectly"
+    )
+}
+
+# Suggestions for any *Connection*/*Timeout* error type
+NETWORK_SUGGESTIONS = (
+    "Verify the service/server is running",
+    "Check network connectivity and firewall rules",
+    "Verify URL/endpoint is correct",
+    "Check for rate limiting or service outages"
+)
+
+# Suggestions for every other error type
+GENERIC_SUGGESTIONS = (
+    "Add print statements before the error line",
+    "Check recent changes to related code",
+    "Review error message for specific details",
+    "Test with simpler input data"
+)
+
+# Python: final "SomeError: message" line, and 'File "path", line N, in func'
+# frames on lines starting with "File " (the line after a frame, its code, is
+# captured without being consumed so it can be a frame itself)
+PYTHON_ERROR_RE = re.compile(r'(\w+Error|Exception):\s*(.*)')
+PYTHON_FRAME_RE = re.compile(
+    r'^[^\S\n]*(?=File )[^\n]*?File "([^"\n]+)", line (\d+)(?:, in (.+))?[^\n]*(?:\n(?=([^\n]*)))?',
+    re.MULTILINE
+)
+
+# Report lines buffered before a write, so huge call stacks aren't held twice
+REPORT_FLUSH_LINES = 10000
+
+# Line separating traces in --batch input
+BATCH_SEPARATOR_RE = re.compile(r'^---[ \t]*$', re.MULTILINE)
+
+# JavaScript: leading "SomeError: message" line and "at func (file:line:col)" frames
+JS_ERROR_RE = re.compile(r'(\w+Error|Error):\s*(.*)')
+JS_FRAME_RE = re.compile(r'at\s+([^\(]+)\s*\(([^:]+):(\d+):(\d+)\)')
+
+class Frame(NamedTuple):
+    """One call stack entry; code is Python-only, column JavaScript-only"""
+    file: str
+    line: str
+    function: str
+    code: str = ''
+    column: str = None
+
 def parse_python_traceback(text):
     """Parse Python stack trace"""
-    lines = text.strip().split('\n')
+    text = text.strip()
     
     # Find error type
-    error_line = lines[-1] if lines else ""
-    error_match = re.match(r'(\w+Error|Exception):\s*(.*)', error_line)
+    error_line = text[text.rfind('\n') + 1:]
+    error_match = PYTHON_ERROR_RE.match(error_line)
     
     if not error_match:
         return None
@@ -49,27 +123,11 @@ def parse_python_traceback(text):
     error_type = error_match.group(1)
     error_message = error_match.group(2)
     
-    # Parse call stack
+    # Parse call stack in one pass over the whole trace
     call_stack = []
-    for i, line in enumerate(lines):
-        if line.strip().startswith('File '):
-            file_match = re.search(r'File "([^"]+)", line (\d+)(?:, in (.+))?', line)
-            if file_match:
-                file_path = file_match.group(1)
-                line_no = file_match.group(2)
-                function = file_match.group(3) or '<module>'
-                
-                # Get the code line (usually next line)
-                code_line = ""
-                if i + 1 < len(lines):
-                    code_line = lines[i + 1].strip()
-                
-                call_stack.append({
-                    'file': file_path,
-                    'line': line_no,
-                    'function': function,
-                    'code': code_line
-                })
+    for file_path, line_no, function, code_line in PYTHON_FRAME_RE.findall(text):
+        # The code line (usually next line)
+        call_stack.append(Frame(file_path, line_no, function or '<module>', code_line.strip()))
     
     return {
         'language': 'Python',
@@ -84,7 +142,7 @@ def parse_javascript_traceback(text):
     
     # Usually first line is the error
     error_line = lines[0] if lines else ""
-    error_match = re.match(r'(\w+Error|Error):\s*(.*)', error_line)
+    error_match = JS_ERROR_RE.match(error_line)
     
     if not error_match:
         return None
@@ -97,14 +155,11 @@ def parse_javascript_traceback(text):
     for line in lines[1:]:
         if line.strip().startswith('at '):
             # at functionName (file:line:col)
-            match = re.search(r'at\s+([^\(]+)\s*\(([^:]+):(\d+):(\d+)\)', line)
+            match = JS_FRAME_RE.search(line)
             if match:
-                call_stack.append({
-                    'function': match.group(1).strip(),
-                    'file': match.group(2),
-                    'line': match.group(3),
-                    'column': match.group(4)
-                })
+                call_stack.append(Frame(file=match.group(2), line=match.group(3),
+                                        function=match.group(1).strip(),
+                                        column=match.group(4)))
     
     return {
         'language': 'JavaScript',
@@ -115,102 +170,157 @@ def parse_javascript_traceback(text):
 
 def explain_error(parsed):
     """Generate explanation and recommendations"""
-    print("\n" + "="*80)
-    print("STACK TRACE ANALYSIS")
-    print("="*80 + "\n")
+    out = []
+    out.append("\n" + "="*80)
+    out.append("STACK TRACE ANALYSIS")
+    out.append("="*80 + "\n")
     
-    print(f"🔴 ERROR TYPE: {parsed['error_type']}")
-    print(f"📝 MESSAGE: {parsed['error_message']}\n")
+    out.append(f"🔴 ERROR TYPE: {parsed['error_type']}")
+    out.append(f"📝 MESSAGE: {parsed['error_message']}\n")
     
     # Error explanation
-    explanation = ERROR_EXPLANATIONS.get(parsed['error_type'], 
-                                        'Review error message for specific details')
-    print(f"💡 EXPLANATION:\n   {explanation}\n")
+    explanation, suggestions = analysis_for(parsed['error_type'])
+    out.append(f"💡 EXPLANATION:\n   {explanation}\n")
     
     # Call stack
-    if parsed['call_stack']:
-        print("📚 CALL STACK (most recent call last):")
-        for i, frame in enumerate(reversed(parsed['call_stack']), 1):
-            print(f"\n  {i}. {frame.get('function', 'unknown')}")
-            print(f"     File: {frame.get('file', 'unknown')}, Line: {frame.get('line', '?')}")
-            if 'code' in frame and frame['code']:
-                print(f"     Code: {frame['code']}")
+    call_stack = parsed['call_stack']
+    if call_stack:
+        out.append("📚 CALL STACK (most recent call last):")
+        for i, frame in enumerate(call_stack[::-1], 1):
+            out.append(f"\n  {i}. {frame.function}")
+            out.append(f"     File: {frame.file}, Line: {frame.line}")
+            if frame.code:
+                out.append(f"     Code: {frame.code}")
+            if len(out) >= REPORT_FLUSH_LINES:
+                sys.stdout.write('\n'.join(out) + '\n')
+                out.clear()
     
     # Root location (where error occurred)
-    if parsed['call_stack']:
-        root = parsed['call_stack'][-1]
-        print(f"\n🎯 ROOT LOCATION:")
-        print(f"   File: {root.get('file', 'unknown')}")
-        print(f"   Line: {root.get('line', '?')}")
-        print(f"   Function: {root.get('function', 'unknown')}")
+    if call_stack:
+        root = call_stack[-1]
+        out.append(f"\n🎯 ROOT LOCATION:")
+        out.append(f"   File: {root.file}")
+        out.append(f"   Line: {root.line}")
+        out.append(f"   Function: {root.function}")
     
     # Debugging suggestions
-    print(f"\n🔍 DEBUGGING SUGGESTIONS:")
-    suggestions = get_debugging_suggestions(parsed)
+    out.append(f"\n🔍 DEBUGGING SUGGESTIONS:")
     for i, suggestion in enumerate(suggestions, 1):
-        print(f"   {i}. {suggestion}")
+        out.append(f"   {i}. {suggestion}")
+    
+    out.append("\n" + "="*80 + "\n")
     
-    print("\n" + "="*80 + "\n")
+    # One write per REPORT_FLUSH_LINES lines instead of a print() per line
+    sys.stdout.write('\n'.join(out) + '\n')
+
+@lru_cache(maxsize=64)
+def analysis_for(error_type):
+    """Explanation and debugging suggestions for an error type, cached per type"""
+    explanation = ERROR_EXPLANATIONS.get(error_type,
+                                         'Review error message for specific details')
+    
+    suggestions = DEBUGGING_SUGGESTIONS.get(error_type)
+    if suggestions is None:
+        if 'Connection' in error_type or 'Timeout' in error_type:
+            suggestions = NETWORK_SUGGESTIONS
+        else:
+            suggestions = GENERIC_SUGGESTIONS
+    
+    return explanation, suggestions
 
 def get_debugging_suggestions(parsed):
     """Get specific debugging suggestions based on error type"""
-    error_type = parsed['error_type']
-    suggestions = []
-    
-    if error_type == 'KeyError':
-        suggestions = [
-            "Check if the key exists before accessing: if 'key' in dict:",
-            "Use dict.get('key', default_value) for safe access",
-            "Print dictionary keys to verify available keys",
-            "Check for typos in the key name"
-        ]
-    elif error_type == 'IndexError':
-        suggestions = [
-            "Check array length before accessing: if len(array) > index:",
-            "Use enumerate() to iterate safely",
-            "Verify the array is populated with expected data",
-            "Check for off-by-one errors in index calculations"
-        ]
-    elif error_type == 'TypeError':
-        suggestions = [
-            "Print variable types to verify: print(type(variable))",
-            "Check if variables are initialized properly",
-            "Verify function arguments are correct types",
-            "Look for None values being used incorrectly"
-        ]
-    elif 'Connection' in error_type or 'Timeout' in error_type:
-        suggestions = [
-            "Verify the service/server is running",
-            "Check network connectivity and firewall rules",
-            "Verify URL/endpoint is correct",
-            "Check for rate limiting or service outages"
-        ]
-    else:
-        suggestions = [
-            "Add print statements before the error line",
-            "Check recent changes to related code",
-            "Review error message for specific details",
-            "Test with simpler input data"
-        ]
+    return analysis_for(parsed['error_type'])[1]
+
+def read_trace_file(path):
+    """Read a trace file as text mode would, decoding straight from a memory map
+    
+    Skips the whole-file bytes copy that f.read() makes before decoding.
+    """
+    encoding = locale.getpreferredencoding(False)
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, encoding)
+        except (ValueError, OSError):
+            # Empty files and pipes can't be mapped
+            text = f.read().decode(encoding)
+    
+    # Universal newlines
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def parse_traceback(text):
+    """Parse a Python or JavaScript stack trace, or return None"""
+    # Python first: it gives up after checking the last line, so a miss costs
+    # almost nothing, and it has always won when both formats match
+    parsed = parse_python_traceback(text)
+    if not parsed:
+        parsed = parse_javascript_traceback(text)
+    return parsed
+
+def iter_batch_traces(lines):
+    """Group lines into traces at each "---" separator line, skipping blank ones"""
+    trace = []
+    for line in lines:
+        if BATCH_SEPARATOR_RE.match(line):
+            if ''.join(trace).strip():
+                yield ''.join(trace)
+            trace = []
+        else:
+            trace.append(line)
+    if ''.join(trace).strip():
+        yield ''.join(trace)
+
+def explain_batch(lines):
+    """Explain every trace as soon as its separator is read; returns the number parsed
     
-    return suggestions
+    Only one trace is held at a time, so this works on endless pipes
+    (tail -f ... | stack_trace_parser.py --batch).
+    """
+    parsed_count = 0
+    for i, trace in enumerate(iter_batch_traces(lines), 1):
+        parsed = parse_traceback(trace)
+        if parsed:
+            explain_error(parsed)
+            parsed_count += 1
+        else:
+            print(f"❌ Could not parse stack trace {i}")
+        sys.stdout.flush()
+    return parsed_count
 
 def main():
-    # Read input from file or stdin
-    if len(sys.argv) > 1:
+    args = sys.argv[1:]
+    batch = '--batch' in args
+    if batch:
+        args.remove('--batch')
+    
+    # Read input from file or stdin; batch input is streamed line by line
+    if args:
         try:
-            with open(sys.argv[1], 'r') as f:
-                text = f.read()
+            if batch:
+                source = open(args[0], 'r')
+            else:
+                text = read_trace_file(args[0])
         except FileNotFoundError:
-            print(f"❌ File not found: {sys.argv[1]}")
+            print(f"❌ File not found: {args[0]}")
             sys.exit(1)
+    elif batch:
+        source = sys.stdin
     else:
         text = sys.stdin.read()
     
+    if batch:
+        with source:
+            parsed_count = explain_batch(source)
+        if not parsed_count:
+            print("❌ No stack traces could be parsed")
+            sys.exit(1)
+        return
+    
     # Try to parse as Python or JavaScript
-    parsed = parse_python_traceback(text)
-    if not parsed:
-        parsed = parse_javascript_traceback(text)
+    parsed = parse_traceback(text)
     
     if parsed:
         explain_error(parsed)
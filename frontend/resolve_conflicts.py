@@ -1,39 +1,104 @@
 #!/usr/bin/env python3
 import os
 import re
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Conflict block marker lines: <<<<<<< HEAD\n...content...\n=======\n...other content...\n>>>>>>> hash
+# (no leading ^, which would disable re's fast literal search; see find_line)
+# Markers are ASCII, so files are scanned as bytes and never decoded
+HEAD_MARKER_RE = re.compile(rb'<<<<<<< HEAD$', re.MULTILINE)
+SEPARATOR_MARKER_RE = re.compile(rb'=======$', re.MULTILINE)
+OTHER_MARKER_RE = re.compile(rb'>>>>>>> [^\n]+')
+
+# Files resolved concurrently; reads and writes release the GIL
+MAX_WORKERS = 8
+
+def find_line(pattern, content, pos):
+    """First match of pattern at or after pos that starts at the beginning of a line."""
+    match = pattern.search(content, pos)
+    while match and match.start() and content[match.start() - 1] != 0x0A:
+        match = pattern.search(content, match.start() + 1)
+    return match
+
+def keep_head_side(content):
+    """Replace every conflict block in content with its HEAD side.
+
+    Jumps from one marker line to the next, so text outside conflicts is
+    copied in slices instead of being walked line by line.
+    """
+    out = []
+    pos = 0
+    while True:
+        head = find_line(HEAD_MARKER_RE, content, pos)
+        if not head:
+            break
+        separator = find_line(SEPARATOR_MARKER_RE, content, head.end() + 1)
+        if not separator:
+            break
+        other = find_line(OTHER_MARKER_RE, content, separator.end() + 1)
+        if not other:
+            # Unterminated conflict: leave it as it was
+            break
+        out.append(content[pos:head.start()])
+        out.append(content[head.end() + 1:separator.start()])
+        pos = other.end() + 1
+    out.append(content[pos:])
+
+    resolved = b''.join(out)
+    if pos > len(content) and resolved.endswith(b'\n'):
+        # Closing marker was the last line, without a newline
+        resolved = resolved[:-1]
+    return resolved
+
+def replace_file(filepath, data):
+    """Atomically replace filepath with data via a sibling temp file."""
+    target = os.path.realpath(filepath)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.resolve-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        shutil.copymode(target, tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
 def resolve_conflict_in_file(filepath):
-    """Resolve merge conflicts by keeping HEAD version."""
+    """Resolve merge conflicts by keeping HEAD version.
+
+    Returns (resolved, status line or None); nothing is printed, so files
+    can be resolved from worker threads and reported in order.
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(filepath, 'rb', buffering=0) as f:
+            raw = f.read()
 
         # Check if file has conflicts
-        if '<<<<<<< HEAD' not in content:
-            return False
+        if b'<<<<<<< HEAD' not in raw:
+            return False, None
 
-        # Pattern to match conflict blocks and keep HEAD version
-        # Matches: <<<<<<< HEAD\n...content...\n=======\n...other content...\n>>>>>>> hash
-        pattern = r'<<<<<<< HEAD\n(.*?)\n=======\n.*?\n>>>>>>> [^\n]+\n'
+        # Universal newlines, as text mode would; other bytes pass through as is
+        content = raw.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
 
         # Replace with just the HEAD content
-        resolved = re.sub(pattern, r'\1\n', content, flags=re.DOTALL)
+        resolved = keep_head_side(content)
 
-        # Also handle conflicts without newline after HEAD marker
-        pattern2 = r'<<<<<<< HEAD\n(.*?)\n=======\n.*?\n>>>>>>> [^\n]+'
-        resolved = re.sub(pattern2, r'\1', resolved, flags=re.DOTALL)
+        # Text mode wrote os.linesep for each newline (CRLF on Windows)
+        if os.linesep != '\n':
+            resolved = resolved.replace(b'\n', os.linesep.encode())
 
-        # Write resolved content back
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(resolved)
+        # Write resolved content back; a crash leaves the old file in place
+        replace_file(filepath, resolved)
 
-        print(f"✓ Resolved: {filepath}")
-        return True
+        return True, f"✓ Resolved: {filepath}"
 
     except Exception as e:
-        print(f"✗ Error in {filepath}: {e}")
-        return False
+        return False, f"✗ Error in {filepath}: {e}"
 
 def main():
     files = [
@@ -64,10 +129,13 @@ def main():
         "src/store/authStore.ts",
     ]
 
+    existing = [filepath for filepath in files if os.path.exists(filepath)]
     resolved_count = 0
-    for filepath in files:
-        if os.path.exists(filepath):
-            if resolve_conflict_in_file(filepath):
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for resolved, message in executor.map(resolve_conflict_in_file, existing):
+            if message:
+                print(message)
+            if resolved:
                 resolved_count += 1
 
     print(f"\nResolved conflicts in {resolved_count} files.")